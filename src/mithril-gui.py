@@ -1,21 +1,30 @@
 import sys
 import os
+import functools
 import json
-import subprocess
+import re
 import shlex
 import shutil
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QListWidget, QStackedWidget, QMenuBar, QFileDialog, QInputDialog, QMessageBox,
+    QListView, QStackedWidget, QMenuBar, QFileDialog, QInputDialog, QMessageBox,
     QDialog, QFormLayout, QLineEdit, QLabel, QDialogButtonBox, QComboBox,
-    QListWidgetItem, QCheckBox, QSystemTrayIcon, QMenu, QTextEdit, QToolButton, QGroupBox,
+    QCheckBox, QSystemTrayIcon, QMenu, QTextEdit, QToolButton, QGroupBox, QSpinBox,
     QWizard, QWizardPage, QTextBrowser, QGridLayout, QFrame, QRadioButton)
-from PyQt6.QtCore import QSize, Qt, QPropertyAnimation, QEasingCurve, QSettings, QTimer
-from PyQt6.QtGui import QAction, QIcon, QPixmap
+from PyQt6.QtCore import (
+    QSize, Qt, QAbstractListModel, QModelIndex, QPropertyAnimation, QEasingCurve, QSettings, QTimer, QStringListModel, QSocketNotifier,
+    QProcess, QThreadPool, QUrl, pyqtSignal)
+from PyQt6.QtGui import QAction, QDesktopServices, QIcon, QKeySequence, QPixmap, QTextCursor
+from password_cache import PasswordCache, wipe
 from terminal_support import TerminalManager
+try:
+    import orjson  # Optional: faster profile (de)serialization.
+except ImportError:
+    orjson = None
 # Only set Linux-specific Qt platform on Linux if not already specified by the environment.
 if sys.platform.startswith("linux"):
     os.environ.setdefault("QT_QPA_PLATFORMTHEME", "gtk3")
@@ -30,32 +39,34 @@ ICONS_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, os.pardir, "icons"))
 # --- Configuration ---
 ORGANIZATION_NAME = "GocryptfsGUI"
 APPLICATION_NAME = "GocryptfsManager"
-PROFILES_FILE = os.path.join(os.path.expanduser("~"), ".config", APPLICATION_NAME, "profiles.json")
+# Resolved once; expanduser goes through $HOME/pwd lookups on every call.
+HOME_DIR = os.path.expanduser("~")
+PROFILES_DIR = os.path.join(HOME_DIR, ".config", APPLICATION_NAME)
+PROFILES_FILE = os.path.join(PROFILES_DIR, "profiles.json")
 SENSITIVE_FLAGS = {
     "-passfile", "--passfile",
     "-extpass", "--extpass",
     "-config"
 }
+DEFAULT_CIPHER_DIRS = (HOME_DIR + "/Encrypted", HOME_DIR + "/.local/share/gocryptfs/cipher")
+DEFAULT_MOUNT_POINTS = (HOME_DIR + "/Secure", HOME_DIR + "/Private")
+# Avoid per-entry symlink resolution and icon lookups, which stall on network mounts.
+DIRECTORY_DIALOG_OPTIONS = (
+    QFileDialog.Option.ShowDirsOnly
+    | QFileDialog.Option.DontResolveSymlinks
+    | QFileDialog.Option.DontUseCustomDirectoryIcons
+)
 
 # --- Path safety helpers ---
 def _is_under(base: Path, target: Path) -> bool:
-    try:
-        return os.path.commonpath([str(base), str(target)]) == str(base)
-    except Exception:
-        return False
+    return target.is_relative_to(base)
 
 def _resolve_path(p: str) -> Path:
     return Path(p).expanduser().resolve(strict=False)
 
 def _is_path_allowed(target: Path, allowed_roots) -> bool:
-    for root in allowed_roots:
-        try:
-            root_resolved = _resolve_path(str(root))
-        except Exception:
-            continue
-        if _is_under(root_resolved, target):
-            return True
-    return False
+    """allowed_roots must already be resolved (see _resolve_path); resolving walks the filesystem."""
+    return any(_is_under(root, target) for root in allowed_roots)
 
 def _count_entries(path: Path, limit: int = 500) -> int:
     """Return a bounded count of direct children to inform deletion prompts."""
@@ -71,57 +82,216 @@ def _count_entries(path: Path, limit: int = 500) -> int:
         return 0
 
 
+GOCRYPTFS_CONF = "gocryptfs.conf"
+
+def is_gocryptfs_initialized(cipher_dir: str) -> bool:
+    try:
+        os.stat(f"{cipher_dir}/{GOCRYPTFS_CONF}")
+    except OSError:
+        return False
+    return True
+
+def ensure_directory(path: str, private: bool = False) -> None:
+    """Create path if missing; with private=True also make sure it ends up mode 700."""
+    if not private:
+        os.makedirs(path, exist_ok=True)
+        return
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    # Only pre-existing directories can have a different mode.
+    if os.stat(path).st_mode & 0o777 != 0o700:
+        os.chmod(path, 0o700)
+
+def _dir_has_entries(path) -> bool:
+    """Return True if the directory has at least one entry, reading no further."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
+
+
 def _append_delete_audit(entries):
     try:
         log_dir = Path(PROFILES_FILE).parent
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / "secure_delete.log"
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        prefix = datetime.utcnow().isoformat() + "Z | "
         with log_file.open("a", encoding="utf-8") as f:
-            for entry in entries:
-                f.write(f"{timestamp} | {entry}\n")
+            f.write("".join(f"{prefix}{entry}\n" for entry in entries))
     except Exception:
         # Audit log is best-effort
         pass
 
+def dump_profiles(profiles) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(profiles, option=orjson.OPT_INDENT_2)
+    return json.dumps(profiles, indent=2, ensure_ascii=False).encode("utf-8")
+
+def parse_profiles(data: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """Write data to a sibling temp file and rename it over path."""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+# Field 5 of mountinfo is the mount point; the filesystem type follows the " - " separator.
+_MOUNTINFO_RE = re.compile(rb"^\d+ \d+ \S+ \S+ (\S+) .*? - fuse\.gocryptfs ", re.MULTILINE)
+_MOUNTINFO_ESCAPE_RE = re.compile(rb"\\([0-7]{3})")
+# mount(8) fallback: "<source> on <mount point> type fuse.gocryptfs (<options>)".
+_MOUNT_OUTPUT_RE = re.compile(rb"^.*? on (.+?) type fuse\.gocryptfs\b", re.MULTILINE)
+
+def _unescape_mountinfo_field(raw: bytes) -> str:
+    # The kernel octal-escapes spaces, tabs, newlines and backslashes in paths.
+    return os.fsdecode(_MOUNTINFO_ESCAPE_RE.sub(lambda m: bytes([int(m.group(1), 8)]), raw))
+
+def parse_mountinfo(data: bytes) -> set:
+    """Return the gocryptfs mount points listed in a mountinfo table."""
+    return {_unescape_mountinfo_field(m.group(1)) for m in _MOUNTINFO_RE.finditer(data)}
+
 def format_cmd_for_echo(argv):
     redacted = []
-    skip_next = False
-    for arg in argv:
-        if skip_next:
-            redacted.append("<redacted>")
-            skip_next = False
-            continue
-        if arg in SENSITIVE_FLAGS:
-            redacted.append(arg)
-            skip_next = True
-            continue
+    args = iter(argv)
+    for arg in args:
         redacted.append(arg)
-    return " ".join(redacted)
+        # The value following a sensitive flag is consumed here and never echoed.
+        if arg in SENSITIVE_FLAGS and next(args, None) is not None:
+            redacted.append("<redacted>")
+    # The echo goes to a live shell, so quote paths with spaces or shell metacharacters.
+    return shlex.join(redacted)
+
+# binary name -> absolute path; only successful lookups are remembered.
+_EXECUTABLE_PATHS = {}
+
+def resolve_executable(binary: str) -> Optional[str]:
+    path = _EXECUTABLE_PATHS.get(binary)
+    if path is None:
+        # which() checks a path containing a directory directly instead of searching PATH.
+        path = shutil.which(binary)
+        if path is not None:
+            _EXECUTABLE_PATHS[binary] = path
+    return path
 
 def can_exec(binary: str) -> bool:
-    return shutil.which(binary) is not None or (os.path.isabs(binary) and os.access(binary, os.X_OK))
+    return resolve_executable(binary) is not None
+
+def new_volume_id() -> str:
+    return uuid.uuid4().hex
+
+def ensure_volume_ids(profiles) -> None:
+    """Give every volume a stable id; older profiles.json files addressed them by list position."""
+    for profile_data in profiles.values():
+        for vol in profile_data.get("volumes", []):
+            if "id" not in vol:
+                vol["id"] = new_volume_id()
+
+def pinned_volumes(profiles):
+    """Return (profile, position, volume) for every pinned volume, in tray menu order."""
+    return [
+        (profile_name, i, vol)
+        for profile_name, profile_data in profiles.items()
+        for i, vol in enumerate(profile_data.get("volumes", []))
+        if vol.get("pin_to_tray")
+    ]
+
+# Icon names are string literals, so the cache is bounded without LRU eviction.
+@functools.lru_cache(maxsize=None)
+def themed_icon(name: str) -> QIcon:
+    """Theme lookups walk the XDG icon directories, so resolve each name once."""
+    return QIcon.fromTheme(name)
+
+@functools.lru_cache(maxsize=None)
+def bundled_pixmap(name: str) -> QPixmap:
+    """Decode a bundled icon once per process; QPixmap copies share the pixel data."""
+    return QPixmap(os.path.join(ICONS_DIR, name))
+
+APP_ICON_FILE = "mithril.ico" if sys.platform.startswith("win") else "icon_256.png"
+
+@functools.lru_cache(maxsize=None)
+def app_icon() -> QIcon:
+    return QIcon(os.path.join(ICONS_DIR, APP_ICON_FILE))
+
+@functools.lru_cache(maxsize=None)
+def monochrome_tray_icon() -> QIcon:
+    """White silhouette of the logo; the alpha mask scan runs only on first use."""
+    source_pixmap = bundled_pixmap("mithril.png")
+    monochrome_pixmap = QPixmap(source_pixmap.size())
+    monochrome_pixmap.fill(Qt.GlobalColor.white)
+    monochrome_pixmap.setMask(source_pixmap.mask())
+    return QIcon(monochrome_pixmap)
+
+# Shared models for the recommended-path combo boxes, built on first use.
+_PATH_MODELS = {}
+
+def _default_path_model(paths) -> QStringListModel:
+    model = _PATH_MODELS.get(paths)
+    if model is None:
+        model = QStringListModel(list(paths))
+        _PATH_MODELS[paths] = model
+    return model
+
+WARNING_STYLE = "color: orange;"
+EXISTING_FOLDER_WARNING = "⚠️ This folder already exists. Continuing may overwrite or expose existing files."
+
+def _make_warning_label(text: str, visible: bool = False) -> QLabel:
+    label = QLabel(text)
+    label.setStyleSheet(WARNING_STYLE)
+    label.setVisible(visible)
+    return label
+
+def _make_path_combo(paths) -> QComboBox:
+    combo = QComboBox()
+    combo.setEditable(True)
+    # Typed paths must not leak into the shared model.
+    combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+    combo.setModel(_default_path_model(paths))
+    return combo
 
 class ErrorDialog(QDialog):
     """A custom dialog for showing detailed, scrollable error messages."""
-    def __init__(self, message, stderr_text, parent=None):
+    def __init__(self, message="", stderr_text="", parent=None):
         super().__init__(parent)
         self.setWindowTitle("Execution Error")
         self.setMinimumWidth(500)
         layout = QVBoxLayout(self)
 
-        layout.addWidget(QLabel(message))
+        self.message_label = QLabel()
+        layout.addWidget(self.message_label)
 
-        error_output = QTextEdit(stderr_text)
-        error_output.setReadOnly(True)
-        error_output.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-        error_output.setFontFamily("monospace")
-        layout.addWidget(error_output)
+        self.error_output = QTextEdit()
+        self.error_output.setReadOnly(True)
+        self.error_output.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.error_output.setFontFamily("monospace")
+        layout.addWidget(self.error_output)
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+        self.set_content(message, stderr_text)
+
+    def set_content(self, message, stderr_text):
+        self.message_label.setText(message)
+        self.error_output.setPlainText(stderr_text)
+
+    def append_content(self, message, stderr_text):
+        """Add another failure while the dialog is still open (e.g. during Mount All)."""
+        # append() guesses rich text; insert at the end as plain text so '<' in stderr stays literal.
+        self.error_output.moveCursor(QTextCursor.MoveOperation.End)
+        self.error_output.insertPlainText(f"\n\n{message}\n{stderr_text}")
+
 class PasswordDialog(QDialog):
     """A dialog for setting and confirming a password for a new volume."""
     def __init__(self, parent=None):
@@ -174,9 +344,7 @@ class MountPasswordDialog(QDialog):
         layout.addWidget(self.remember_cb, 1, 0, 1, 2)
 
         # Row 2: Error Message (optional)
-        self.error_label = QLabel("⚠️ Incorrect Password")
-        self.error_label.setStyleSheet("color: orange;")
-        self.error_label.setVisible(show_error)
+        self.error_label = _make_warning_label("⚠️ Incorrect Password", show_error)
         layout.addWidget(self.error_label, 2, 0, 1, 2)
 
         # Row 3: Dialog Buttons
@@ -211,36 +379,28 @@ class VolumeDialog(QDialog):
 
         # Row 1: Encrypted Folder
         layout.addWidget(QLabel("Encrypted Folder:"), 1, 0)
-        self.cipher_dir_combo = QComboBox()
-        self.cipher_dir_combo.setEditable(True)
-        self.cipher_dir_combo.addItems([os.path.expanduser(p) for p in ["~/Encrypted", "~/.local/share/gocryptfs/cipher"]])
+        self.cipher_dir_combo = _make_path_combo(DEFAULT_CIPHER_DIRS)
         self.cipher_dir_combo.setToolTip("Recommended location for the encrypted container. Secure, persistent, and private.")
         layout.addWidget(self.cipher_dir_combo, 1, 1)
         
         browse_cipher = QPushButton("Browse...")
-        browse_cipher.clicked.connect(lambda: self.browse_path(self.cipher_dir_combo, "Select Encrypted Folder"))
+        browse_cipher.clicked.connect(functools.partial(self.browse_path, self.cipher_dir_combo, "Select Encrypted Folder"))
         layout.addWidget(browse_cipher, 1, 2)
 
-        self.cipher_warning_label = QLabel("⚠️ This folder already exists. Continuing may overwrite or expose existing files.")
-        self.cipher_warning_label.setStyleSheet("color: orange;")
-        self.cipher_warning_label.setVisible(False)
+        self.cipher_warning_label = _make_warning_label(EXISTING_FOLDER_WARNING)
         layout.addWidget(self.cipher_warning_label, 2, 1, 1, 2)
 
         # Row 3: Mount Point
         layout.addWidget(QLabel("Mount Point:"), 3, 0)
-        self.mount_point_combo = QComboBox()
-        self.mount_point_combo.setEditable(True)
-        self.mount_point_combo.addItems([os.path.expanduser(p) for p in ["~/Secure", "~/Private"]])
+        self.mount_point_combo = _make_path_combo(DEFAULT_MOUNT_POINTS)
         self.mount_point_combo.setToolTip("Recommended location for the decrypted view.")
         layout.addWidget(self.mount_point_combo, 3, 1)
 
         browse_mount = QPushButton("Browse...")
-        browse_mount.clicked.connect(lambda: self.browse_path(self.mount_point_combo, "Select Mount Point"))
+        browse_mount.clicked.connect(functools.partial(self.browse_path, self.mount_point_combo, "Select Mount Point"))
         layout.addWidget(browse_mount, 3, 2)
 
-        self.mount_warning_label = QLabel("⚠️ This folder already exists. Continuing may overwrite or expose existing files.")
-        self.mount_warning_label.setStyleSheet("color: orange;")
-        self.mount_warning_label.setVisible(False)
+        self.mount_warning_label = _make_warning_label(EXISTING_FOLDER_WARNING)
         layout.addWidget(self.mount_warning_label, 4, 1, 1, 2)
 
         # Row 5: Permissions Checkbox
@@ -278,24 +438,59 @@ class VolumeDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addWidget(self.button_box, 10, 0, 1, 3) # Span all 3 columns
 
-        self.cipher_dir_combo.currentTextChanged.connect(self.check_path_existence)
-        self.mount_point_combo.currentTextChanged.connect(self.check_path_existence)
+        # An edited volume's own directories exist by design; only other existing paths are a conflict.
+        self._original_cipher_dir = volume_data.get("cipher_dir") if volume_data else None
+        self._original_mount_point = volume_data.get("mount_point") if volume_data else None
+
+        # Stat paths once typing settles rather than on every keystroke.
+        self._exists_cache = {}
+        self._path_check_timer = QTimer(self)
+        self._path_check_timer.setSingleShot(True)
+        self._path_check_timer.setInterval(150)
+        self._path_check_timer.timeout.connect(self.check_path_existence)
+        self.cipher_dir_combo.currentTextChanged.connect(self._path_check_timer.start)
+        self.mount_point_combo.currentTextChanged.connect(self._path_check_timer.start)
         self.check_path_existence()
 
+    def showEvent(self, event):
+        # Paths may have been created or removed since the dialog was last shown.
+        self._exists_cache.clear()
+        self.check_path_existence()
+        super().showEvent(event)
+
+    _EXISTS_CACHE_SIZE = 64
+
+    def _path_exists(self, path):
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            if len(self._exists_cache) >= self._EXISTS_CACHE_SIZE:
+                # Typing produces a new prefix per keystroke; start over rather than grow without bound.
+                self._exists_cache.clear()
+            exists = self._exists_cache[path] = os.path.exists(path)
+        return exists
+
     def check_path_existence(self):
-        cipher_path = self.cipher_dir_combo.currentText()
-        mount_path = self.mount_point_combo.currentText()
+        self._path_check_timer.stop()
+        cipher_dir = self.cipher_dir_combo.currentText()
+        mount_point = self.mount_point_combo.currentText()
+        cipher_exists = cipher_dir != self._original_cipher_dir and self._path_exists(cipher_dir)
+        mount_exists = mount_point != self._original_mount_point and self._path_exists(mount_point)
 
-        self.cipher_warning_label.setVisible(os.path.exists(cipher_path))
-        self.mount_warning_label.setVisible(os.path.exists(mount_path))
+        self.cipher_warning_label.setVisible(cipher_exists)
+        self.mount_warning_label.setVisible(mount_exists)
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(not cipher_exists and not mount_exists)
 
-        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(
-            not self.cipher_warning_label.isVisible() and not self.mount_warning_label.isVisible()
-        )
+    def accept(self):
+        # Don't let Enter slip past a check that is still waiting on the debounce.
+        if self._path_check_timer.isActive():
+            self.check_path_existence()
+            if not self.button_box.button(QDialogButtonBox.StandardButton.Ok).isEnabled():
+                return
+        super().accept()
 
 
     def browse_path(self, combo, caption):
-        path = QFileDialog.getExistingDirectory(self, caption)
+        path = QFileDialog.getExistingDirectory(self, caption, "", DIRECTORY_DIALOG_OPTIONS)
         if path:
             combo.setCurrentText(path)
 
@@ -311,6 +506,76 @@ class VolumeDialog(QDialog):
             "pin_to_tray": self.pin_to_tray_cb.isChecked(),
         }
 
+def _single_edit_position(old, new):
+    """Index at which one item was inserted into or removed from old to give new, else None."""
+    longer, shorter = (new, old) if len(new) > len(old) else (old, new)
+    if len(longer) != len(shorter) + 1:
+        return None
+    k = next((i for i, (a, b) in enumerate(zip(shorter, longer)) if a != b), len(shorter))
+    return k if longer[k + 1:] == shorter[k:] else None
+
+
+class VolumeListModel(QAbstractListModel):
+    """Favorite volumes as (id, label, mount_point, is_mounted) rows."""
+
+    VolumeIdRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = ()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        volume_id, label, mount_point, is_mounted = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f" {label}"
+        if role == Qt.ItemDataRole.DecorationRole:
+            return themed_icon("emblem-ok" if is_mounted else "emblem-symbolic-link")
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"Mount Point: {mount_point}"
+        if role == self.VolumeIdRole:
+            return volume_id
+        return None
+
+    def set_rows(self, rows):
+        rows = tuple(rows)
+        old_rows = self._rows
+        if rows == old_rows:
+            return
+        old_ids = [row[0] for row in old_rows]
+        new_ids = [row[0] for row in rows]
+        if new_ids != old_ids:
+            # Adding or removing a single volume is the common case; insert or
+            # remove just that row so the view keeps the rest (and the selection).
+            k = _single_edit_position(old_ids, new_ids)
+            if k is None:
+                # Reordered, or several volumes changed at once (profile switch).
+                self.beginResetModel()
+                self._rows = rows
+                self.endResetModel()
+                return
+            if len(new_ids) > len(old_ids):
+                self.beginInsertRows(QModelIndex(), k, k)
+                self._rows = old_rows[:k] + rows[k:k + 1] + old_rows[k:]
+                self.endInsertRows()
+            else:
+                self.beginRemoveRows(QModelIndex(), k, k)
+                self._rows = old_rows[:k] + old_rows[k + 1:]
+                self.endRemoveRows()
+            old_rows = self._rows
+        # Same volumes; repaint only the rows whose label or mount state changed,
+        # which also keeps the current selection.
+        self._rows = rows
+        for row, (old, new) in enumerate(zip(old_rows, rows)):
+            if old != new:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+
 class SimplifiedView(QWidget):
     """The GUI for managing favorite volumes."""
     def __init__(self, main_window):
@@ -328,7 +593,7 @@ class SimplifiedView(QWidget):
         self.profile_combo.currentIndexChanged.connect(self.main_window.switch_profile)
         
         self.manage_profiles_button = QToolButton()
-        self.manage_profiles_button.setIcon(QIcon.fromTheme("document-properties"))
+        self.manage_profiles_button.setIcon(themed_icon("document-properties"))
         self.manage_profiles_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
         self.manage_profiles_menu = QMenu(self)
         self.manage_profiles_button.setMenu(self.manage_profiles_menu)
@@ -341,7 +606,7 @@ class SimplifiedView(QWidget):
         self.rename_profile_action.triggered.connect(self.main_window.rename_profile)
         self.delete_profile_action.triggered.connect(self.main_window.delete_profile)
 
-        self.save_profile_button = QPushButton(QIcon.fromTheme("document-save"), " Save")
+        self.save_profile_button = QPushButton(themed_icon("document-save"), " Save")
         self.save_profile_button.clicked.connect(self.main_window.save_current_profile)
         
         profile_layout.addWidget(self.profile_combo)
@@ -351,17 +616,22 @@ class SimplifiedView(QWidget):
 
         # --- Favorite Volumes List ---
         layout.addWidget(QLabel("<b>Favorite Volumes:</b>"))
-        self.volumes_list = QListWidget()
-        self.volumes_list.itemSelectionChanged.connect(self.main_window.on_volume_selected)
+        self.volumes_list = QListView()
+        self.volumes_model = VolumeListModel(self.volumes_list)
+        self.volumes_list.setModel(self.volumes_model)
+        self.volumes_list.selectionModel().selectionChanged.connect(self.main_window.on_volume_selected)
+        # A reset drops the selection without emitting selectionChanged.
+        self.volumes_model.modelReset.connect(self.main_window.on_volume_selected)
         self.volumes_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.volumes_list.customContextMenuRequested.connect(self.show_volume_context_menu)
+        self._create_context_menu()
         layout.addWidget(self.volumes_list)
 
         # --- Advanced Flags Group ---
         self.advanced_group = QGroupBox("Advanced Flags")
         self.advanced_group.setCheckable(True)
         self.advanced_group.setChecked(False)
-        self.advanced_group.toggled.connect(lambda checked: self.main_window.settings.setValue("advanced_flags_expanded", checked))
+        self.advanced_group.toggled.connect(self._on_advanced_toggled)
         
         advanced_layout = QFormLayout(self.advanced_group)
         self.allow_other_cb = QCheckBox("Allow other users to access files")
@@ -381,15 +651,15 @@ class SimplifiedView(QWidget):
 
         # --- Volume Actions ---
         vol_actions_layout = QHBoxLayout()
-        self.add_button = QPushButton(QIcon.fromTheme("list-add"), " Add")
-        self.edit_button = QPushButton(QIcon.fromTheme("edit-rename"), " Edit")
-        self.remove_button = QPushButton(QIcon.fromTheme("list-remove"), " Remove")
+        self.add_button = QPushButton(themed_icon("list-add"), " Add")
+        self.edit_button = QPushButton(themed_icon("edit-rename"), " Edit")
+        self.remove_button = QPushButton(themed_icon("list-remove"), " Remove")
         vol_actions_layout.addWidget(self.add_button)
         vol_actions_layout.addWidget(self.edit_button)
         vol_actions_layout.addWidget(self.remove_button)
         vol_actions_layout.addStretch()
-        self.mount_button = QPushButton(QIcon.fromTheme("media-playback-start"), " Mount Selected")
-        self.unmount_button = QPushButton(QIcon.fromTheme("media-playback-stop"), " Unmount Selected")
+        self.mount_button = QPushButton(themed_icon("media-playback-start"), " Mount Selected")
+        self.unmount_button = QPushButton(themed_icon("media-playback-stop"), " Unmount Selected")
         vol_actions_layout.addWidget(self.mount_button)
         vol_actions_layout.addWidget(self.unmount_button)
         layout.addLayout(vol_actions_layout)
@@ -401,18 +671,33 @@ class SimplifiedView(QWidget):
         self.mount_button.clicked.connect(self.mount_selected_volume)
         self.unmount_button.clicked.connect(self.unmount_selected_volume)
         
+        # Volume whose flags the advanced group is showing; None while (re)loading.
+        self._flags_volume_id = None
+        # Typing into scryptn saves once the user pauses, not once per character.
+        self._flags_save_timer = QTimer(self)
+        self._flags_save_timer.setSingleShot(True)
+        self._flags_save_timer.setInterval(300)
+        self._flags_save_timer.timeout.connect(self.save_flags)
+
         self.allow_other_cb.stateChanged.connect(self.save_flags)
         self.reverse_cb.stateChanged.connect(self.save_flags)
-        self.scryptn_edit.textChanged.connect(self.save_flags)
+        self.scryptn_edit.textChanged.connect(self._flags_save_timer.start)
 
         self._create_shortcuts()
 
     def _create_shortcuts(self):
-        # These are application-wide shortcuts
-        QAction("Quit", self, shortcut="Ctrl+Q", triggered=self.main_window.close_app)
-        QAction("Add new volume", self, shortcut="Ctrl+N", triggered=self.add_volume)
-        QAction("Re-run setup wizard", self, shortcut="Ctrl+R", triggered=self.main_window.rerun_setup_wizard)
-        QAction("Open Security Guide", self, shortcut="Ctrl+H", triggered=self.main_window.show_security_guide)
+        # Ctrl+Q, Ctrl+R and Ctrl+H belong to the main window's menu actions; registering
+        # them here too would make Qt treat each as ambiguous and fire neither.
+        shortcuts = [
+            ("Add new volume", QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_N), self.add_volume),
+        ]
+        self._shortcuts = []
+        for text, sequence, slot in shortcuts:
+            action = QAction(text, self)
+            action.setShortcut(sequence)
+            action.triggered.connect(slot)
+            self.addAction(action)
+            self._shortcuts.append(action)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
@@ -429,19 +714,25 @@ class SimplifiedView(QWidget):
             super().keyPressEvent(event)
 
     def get_selected_volume_id(self):
-        item = self.volumes_list.currentItem()
-        return item.data(Qt.ItemDataRole.UserRole) if item else None
+        index = self.volumes_list.currentIndex()
+        return index.data(VolumeListModel.VolumeIdRole) if index.isValid() else None
+
+    def select_profile(self, profile_name):
+        # On an editable combo setCurrentText only replaces the edit text; the
+        # current index (and so switch_profile) has to be moved explicitly.
+        self.profile_combo.setCurrentIndex(self.profile_combo.findText(profile_name))
 
     def add_volume(self):
         dialog = VolumeDialog(parent=self)
         if dialog.exec():
             volume_data = dialog.get_data()
-            self.main_window.create_and_initialize_volume(volume_data)
+            self.main_window.add_volume_to_profile(volume_data)
 
     def edit_volume(self):
         volume_id = self.get_selected_volume_id()
         if volume_id is None: return
-        volume_data = self.main_window.profiles[self.main_window.current_profile_name]["volumes"][volume_id]
+        volume_data = self.main_window.get_volume(volume_id)
+        if volume_data is None: return
 
         dialog = VolumeDialog(volume_data, self)
         if dialog.exec():
@@ -458,40 +749,51 @@ class SimplifiedView(QWidget):
         volume_id = self.get_selected_volume_id()
         if volume_id is None: return
         
-        volume_data = self.main_window.profiles[self.main_window.current_profile_name]["volumes"][volume_id]
+        volume_data = self.main_window.get_volume(volume_id)
+        if volume_data is None: return
         dialog = SecureDeleteDialog(volume_data, self)
         if dialog.exec():
             self.main_window.secure_delete_volume_from_disk(volume_id)
 
     def show_volume_context_menu(self, pos):
-        item = self.volumes_list.itemAt(pos)
-        if not item:
+        index = self.volumes_list.indexAt(pos)
+        if not index.isValid():
             return
 
-        volume_id = item.data(Qt.ItemDataRole.UserRole)
-        volume_data = self.main_window.profiles[self.main_window.current_profile_name]["volumes"][volume_id]
+        volume_id = index.data(VolumeListModel.VolumeIdRole)
+        volume_data = self.main_window.get_volume(volume_id)
+        if volume_data is None:
+            return
         is_mounted = volume_data.get('mount_point') in self.main_window.mounted_paths
 
-        menu = QMenu()
-        
+        self._context_volume_id = volume_id
+        self._ctx_unmount_action.setVisible(is_mounted)
+        self._ctx_open_files_action.setVisible(is_mounted)
+        self._ctx_mount_action.setVisible(not is_mounted)
+        # setChecked does not emit triggered, so this cannot toggle the pin by itself.
+        self._ctx_pin_action.setChecked(volume_data.get("pin_to_tray", False))
+        self._context_menu.exec(self.volumes_list.mapToGlobal(pos))
+
+    def _create_context_menu(self):
+        # Built once; show_volume_context_menu only adjusts it for the clicked volume.
+        self._context_volume_id = None
+        menu = QMenu(self)
+
         # ─── Primary Actions ───────────────────────────
-        if is_mounted:
-            menu.addAction("Unmount", self.unmount_selected_volume)
-            menu.addAction("Open Files", lambda: self.main_window.open_folder(volume_data.get('mount_point')))
-        else:
-            menu.addAction("Mount", self.mount_selected_volume)
+        self._ctx_unmount_action = menu.addAction("Unmount", self.unmount_selected_volume)
+        self._ctx_open_files_action = menu.addAction("Open Files", self._open_context_mount_point)
+        self._ctx_mount_action = menu.addAction("Mount", self.mount_selected_volume)
 
-        menu.addAction("Show Encrypted Storage Folder", lambda: self.main_window.open_folder(volume_data.get('cipher_dir')))
+        menu.addAction("Show Encrypted Storage Folder", self._open_context_cipher_dir)
 
         menu.addSeparator()
 
         # ─── Management Tools ──────────────────────────
         menu.addAction("Edit Volume", self.edit_volume)
 
-        pin_action = menu.addAction("Pin to Tray")
-        pin_action.setCheckable(True)
-        pin_action.setChecked(volume_data.get("pin_to_tray", False))
-        pin_action.triggered.connect(lambda checked, vol_id=volume_id: self.main_window.toggle_pin_volume(vol_id, checked))
+        self._ctx_pin_action = menu.addAction("Pin to Tray")
+        self._ctx_pin_action.setCheckable(True)
+        self._ctx_pin_action.triggered.connect(self._toggle_context_pin)
 
         menu.addSeparator()
 
@@ -499,7 +801,20 @@ class SimplifiedView(QWidget):
         menu.addAction("Remove from Favorites", self.remove_volume)
         menu.addAction("Delete Encrypted Volume...", self.secure_delete_volume)
 
-        menu.exec(self.volumes_list.mapToGlobal(pos))
+        self._context_menu = menu
+
+    def _open_context_mount_point(self):
+        volume = self.main_window.get_volume(self._context_volume_id)
+        if volume is not None:
+            self.main_window.open_folder(volume.get('mount_point'))
+
+    def _open_context_cipher_dir(self):
+        volume = self.main_window.get_volume(self._context_volume_id)
+        if volume is not None:
+            self.main_window.open_folder(volume.get('cipher_dir'))
+
+    def _toggle_context_pin(self, checked):
+        self.main_window.toggle_pin_volume(self._context_volume_id, checked)
 
     def mount_selected_volume(self):
         volume_id = self.get_selected_volume_id()
@@ -511,7 +826,19 @@ class SimplifiedView(QWidget):
         if volume_id is None: return
         self.main_window.unmount_volume(volume_id)
         
+    def _on_advanced_toggled(self, checked):
+        self.main_window.settings.setValue("advanced_flags_expanded", checked)
+
+    def flush_pending_flags(self):
+        """Save a scryptn edit that is still waiting on the debounce timer."""
+        if self._flags_save_timer.isActive():
+            self._flags_save_timer.stop()
+            self.save_flags()
+
     def load_flags_for_volume(self, volume_id):
+        # The pending edit belongs to the previously shown volume.
+        self.flush_pending_flags()
+        self._flags_volume_id = None
         if volume_id is None:
             self.advanced_group.setEnabled(False)
             self.allow_other_cb.setChecked(False)
@@ -519,10 +846,9 @@ class SimplifiedView(QWidget):
             self.scryptn_edit.clear()
             return
 
-        profile_name = self.main_window.current_profile_name
-        volumes = self.main_window.profiles[profile_name].get("volumes", [])
-        if volume_id >= len(volumes):
-            # This can happen if the last item was just deleted.
+        volume = self.main_window.get_volume(volume_id)
+        if volume is None:
+            # This can happen if the volume was just deleted.
             self.advanced_group.setEnabled(False)
             self.allow_other_cb.setChecked(False)
             self.reverse_cb.setChecked(False)
@@ -530,14 +856,17 @@ class SimplifiedView(QWidget):
             return
 
         self.advanced_group.setEnabled(True)
-        all_flags = volumes[volume_id].get("flags", {})
+        all_flags = volume.get("flags", {})
 
         self.allow_other_cb.setChecked(all_flags.get("allow_other", False))
         self.reverse_cb.setChecked(all_flags.get("reverse", False))
         self.scryptn_edit.setText(all_flags.get("scryptn", ""))
+        # Loading the fields is not an edit.
+        self._flags_save_timer.stop()
+        self._flags_volume_id = volume_id
 
     def save_flags(self):
-        volume_id = self.get_selected_volume_id()
+        volume_id = self._flags_volume_id
         if volume_id is None: return
 
         flags = {
@@ -548,6 +877,56 @@ class SimplifiedView(QWidget):
         self.main_window.update_volume_flags(volume_id, flags)
 
 
+SECURITY_GUIDE_HTML = """
+<h1>Security Best Practices</h1>
+<p>Mithril is designed with security and simplicity in mind. To help you make the most of your encrypted volumes, we recommend the following:</p>
+
+<h2>Recommended Folder Locations</h2>
+<ul>
+    <li><b>Encrypted Folder:</b>
+        <ul>
+            <li><code>~/Encrypted</code></li>
+            <li><code>~/.local/share/gocryptfs/cipher</code></li>
+        </ul>
+        <p>These locations are private, easy to back up securely, and hidden from casual browsing.</p>
+    </li>
+    <li><b>Mount Point (Decrypted View):</b>
+        <ul>
+            <li><code>~/Secure</code></li>
+            <li><code>~/Private</code></li>
+        </ul>
+        <p>These folders display your decrypted files while the volume is mounted.</p>
+    </li>
+</ul>
+
+<h2>Permissions</h2>
+<p>New folders should be created with owner-only access: <code>chmod 700 /your/folder/path</code>. Mithril will do this for you automatically unless you opt out.</p>
+
+<h2>Passwords</h2>
+<ul>
+    <li>Use strong, unique passphrases.</li>
+    <li>Do not reuse volume passphrases for login or websites.</li>
+    <li>Avoid storing them in plaintext.</li>
+</ul>
+
+<h2>Unlocking and Mounting</h2>
+<ul>
+    <li>Always unmount when you're done — this re-locks your data.</li>
+    <li>Never leave your mount point open on shared systems.</li>
+</ul>
+
+<h2>Backup</h2>
+<ul>
+    <li>Back up your <b>encrypted</b> folder, not the decrypted one.</li>
+    <li>Backups remain secure even if stolen, so long as your passphrase is strong.</li>
+</ul>
+
+<hr>
+
+<p>For more advanced topics, see the <a href="https://github.com/rfjakob/gocryptfs">gocryptfs documentation</a>. Mithril is a wrapper — the encryption is handled by the trusted gocryptfs tool underneath.</p>
+"""
+
+
 class SecurityGuideDialog(QDialog):
     """A dialog displaying security best practices."""
     def __init__(self, parent=None):
@@ -556,63 +935,40 @@ class SecurityGuideDialog(QDialog):
         self.setMinimumSize(600, 400)
 
         layout = QVBoxLayout(self)
-        text_browser = QTextBrowser()
-        text_browser.setOpenExternalLinks(True)
-        layout.addWidget(text_browser)
-
-        content = """
-        <h1>Security Best Practices</h1>
-        <p>Mithril is designed with security and simplicity in mind. To help you make the most of your encrypted volumes, we recommend the following:</p>
-        
-        <h2>Recommended Folder Locations</h2>
-        <ul>
-            <li><b>Encrypted Folder:</b>
-                <ul>
-                    <li><code>~/Encrypted</code></li>
-                    <li><code>~/.local/share/gocryptfs/cipher</code></li>
-                </ul>
-                <p>These locations are private, easy to back up securely, and hidden from casual browsing.</p>
-            </li>
-            <li><b>Mount Point (Decrypted View):</b>
-                <ul>
-                    <li><code>~/Secure</code></li>
-                    <li><code>~/Private</code></li>
-                </ul>
-                <p>These folders display your decrypted files while the volume is mounted.</p>
-            </li>
-        </ul>
-
-        <h2>Permissions</h2>
-        <p>New folders should be created with owner-only access: <code>chmod 700 /your/folder/path</code>. Mithril will do this for you automatically unless you opt out.</p>
+        self.text_browser = QTextBrowser()
+        self.text_browser.setOpenExternalLinks(True)
+        layout.addWidget(self.text_browser)
 
-        <h2>Passwords</h2>
-        <ul>
-            <li>Use strong, unique passphrases.</li>
-            <li>Do not reuse volume passphrases for login or websites.</li>
-            <li>Avoid storing them in plaintext.</li>
-        </ul>
+    def showEvent(self, event):
+        # Parse the guide only once the dialog is actually displayed.
+        if self.text_browser.document().isEmpty():
+            self.text_browser.setHtml(SECURITY_GUIDE_HTML)
+        super().showEvent(event)
+
+SHORTCUTS = {
+    "Enter": "Mount selected volume",
+    "Ctrl + Enter": "Edit selected volume",
+    "Del": "Remove volume from favorites",
+    "Shift + Del": "Secure delete encrypted volume from disk",
+    "Ctrl + N": "Add new volume",
+    "Ctrl + ,": "Open Preferences",
+    "Ctrl + R": "Re-run setup wizard",
+    "Ctrl + H": "Open Security Guide",
+    "Ctrl + Q": "Quit application",
+    "F1": "Show this help",
+}
 
-        <h2>Unlocking and Mounting</h2>
-        <ul>
-            <li>Always unmount when you're done — this re-locks your data.</li>
-            <li>Never leave your mount point open on shared systems.</li>
-        </ul>
+SHORTCUTS_HTML = """
+<style>
+    h1 { text-align: center; }
+    table { width: 90%; margin-left: 5%; margin-right: 1%; }
+    td { padding: 4px; }
+    td:first-child { font-weight: bold; }
+</style>
+<h1>Keyboard Shortcuts</h1>
+<table>
+""" + "".join(f"<tr><td>{key}</td><td>{action}</td></tr>" for key, action in SHORTCUTS.items()) + "</table>"
 
-        <h2>Backup</h2>
-        <ul>
-            <li>Back up your <b>encrypted</b> folder, not the decrypted one.</li>
-            <li>Backups remain secure even if stolen, so long as your passphrase is strong.</li>
-        </ul>
-        
-        # Add a styled horizontal line
-        line = QFrame()
-        line.setFrameShape(QFrame.Shape.HLine)
-        line.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(line)
-        
-        <p>For more advanced topics, see the <a href="https://github.com/rfjakob/gocryptfs">gocryptfs documentation</a>. Mithril is a wrapper — the encryption is handled by the trusted gocryptfs tool underneath.</p>
-        """
-        text_browser.setHtml(content)
 
 class ShortcutsDialog(QDialog):
     """A dialog displaying keyboard shortcuts."""
@@ -625,34 +981,7 @@ class ShortcutsDialog(QDialog):
         self.text_browser.setOpenExternalLinks(True)
         layout.addWidget(self.text_browser)
 
-        shortcuts = {
-            "Enter": "Mount selected volume",
-            "Ctrl + Enter": "Edit selected volume",
-            "Del": "Remove volume from favorites",
-            "Shift + Del": "Secure delete encrypted volume from disk",
-            "Ctrl + N": "Add new volume",
-            "Ctrl + ,": "Open Preferences",
-            "Ctrl + R": "Re-run setup wizard",
-            "Ctrl + H": "Open Security Guide",
-            "Ctrl + Q": "Quit application",
-            "F1": "Show this help",
-        }
-
-        content = """
-        <style>
-            h1 { text-align: center; }
-            table { width: 90%; margin-left: 5%; margin-right: 1%; }
-            td { padding: 4px; }
-            td:first-child { font-weight: bold; }
-        </style>
-        <h1>Keyboard Shortcuts</h1>
-        <table>
-        """
-        for key, action in shortcuts.items():
-            content += f"<tr><td>{key}</td><td>{action}</td></tr>"
-        content += "</table>"
-        
-        self.text_browser.setHtml(content)
+        self.text_browser.setHtml(SHORTCUTS_HTML)
         
         # Defer resizing and centering
         QTimer.singleShot(0, self.resize_and_center)
@@ -704,12 +1033,12 @@ class SecureDeleteDialog(QDialog):
 
 class PreferencesDialog(QDialog):
     """A dialog for setting application preferences."""
-    def __init__(self, parent=None):
+    def __init__(self, settings: QSettings, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Preferences")
         self.setMinimumWidth(400)
 
-        self.settings = QSettings(ORGANIZATION_NAME, APPLICATION_NAME)
+        self.settings = settings
         layout = QVBoxLayout(self)
 
         # --- Close Behavior ---
@@ -719,29 +1048,46 @@ class PreferencesDialog(QDialog):
         self.quit_radio = QRadioButton("Quit application")
         close_layout.addWidget(self.minimize_radio)
         close_layout.addWidget(self.quit_radio)
-        
-        current_close_behavior = self.settings.value("close_behavior", "minimize", type=str)
-        if current_close_behavior == "quit":
-            self.quit_radio.setChecked(True)
-        else:
-            self.minimize_radio.setChecked(True)
-            
         layout.addWidget(close_group)
 
         # --- Volume Creation ---
         creation_group = QGroupBox("Volume Creation")
         creation_layout = QFormLayout(creation_group)
         self.automount_new_cb = QCheckBox("Auto-mount new volumes after creation")
-        self.automount_new_cb.setChecked(self.settings.value("automount_on_creation", True, type=bool))
         creation_layout.addRow(self.automount_new_cb)
         layout.addWidget(creation_group)
 
+        # --- Password Cache ---
+        security_group = QGroupBox("Remembered Password")
+        security_layout = QFormLayout(security_group)
+        self.password_ttl_spin = QSpinBox()
+        self.password_ttl_spin.setRange(0, 24 * 60)
+        self.password_ttl_spin.setSuffix(" min")
+        self.password_ttl_spin.setSpecialValueText("End of session")
+        security_layout.addRow("Forget after:", self.password_ttl_spin)
+        layout.addWidget(security_group)
+
         # --- Dialog Buttons ---
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def showEvent(self, event):
+        # The dialog is reused, so show the current settings, not the last edit that was cancelled.
+        # Spontaneous shows (e.g. un-minimizing) must keep whatever is being edited.
+        if not event.spontaneous():
+            self.load_settings()
+        super().showEvent(event)
+
+    def load_settings(self):
+        if self.settings.value("close_behavior", "minimize", type=str) == "quit":
+            self.quit_radio.setChecked(True)
+        else:
+            self.minimize_radio.setChecked(True)
+        self.automount_new_cb.setChecked(self.settings.value("automount_on_creation", True, type=bool))
+        self.password_ttl_spin.setValue(self.settings.value("password_cache_minutes", 0, type=int))
+
     def accept(self):
         if self.quit_radio.isChecked():
             self.settings.setValue("close_behavior", "quit")
@@ -749,6 +1095,7 @@ class PreferencesDialog(QDialog):
             self.settings.setValue("close_behavior", "minimize")
         
         self.settings.setValue("automount_on_creation", self.automount_new_cb.isChecked())
+        self.settings.setValue("password_cache_minutes", self.password_ttl_spin.value())
         super().accept()
 
 
@@ -949,6 +1296,19 @@ class MithrilSetupWizard(QWizard):
         # This is called when the user clicks "Finish"
         super().accept()
 
+    def volume_data(self):
+        """The new volume as entered in the wizard, in profile form."""
+        return {
+            "label": self.field("volumeLabel"),
+            "cipher_dir": self.field("cipherDir"),
+            "mount_point": self.field("mountPoint"),
+            "apply_perms": self.field("applyPerms"),
+            "auto_open_mount": self.field("openFolder"),
+            "automount_on_startup": False, # Default for new volumes
+            "volume_type": "standard", # Default for new volumes
+            "pin_to_tray": False, # Default for new volumes
+        }
+
 
 class WelcomePage(QWizardPage):
     def __init__(self, parent=None):
@@ -960,10 +1320,9 @@ class WelcomePage(QWizardPage):
         
         # --- Icon ---
         icon_label = QLabel()
-        # A check for the existence of the icon file
-        icon_path = os.path.join(ICONS_DIR, "icon_128.png")
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
+        # A null pixmap means the icon file is missing or unreadable.
+        pixmap = bundled_pixmap("icon_128.png")
+        if not pixmap.isNull():
             icon_label.setPixmap(pixmap)
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon_label)
@@ -989,9 +1348,7 @@ class CreateVolumePage(QWizardPage):
         layout.addWidget(QLabel("Volume Label:"), 0, 0)
         layout.addWidget(self.label_edit, 0, 1, 1, 2)
 
-        self.cipher_dir_combo = QComboBox()
-        self.cipher_dir_combo.setEditable(True)
-        self.cipher_dir_combo.addItems([os.path.expanduser("~/Encrypted"), os.path.expanduser("~/.local/share/gocryptfs/cipher")])
+        self.cipher_dir_combo = _make_path_combo(DEFAULT_CIPHER_DIRS)
         self.cipher_dir_combo.setToolTip("Recommended location for the encrypted container. Secure, persistent, and private.")
         layout.addWidget(QLabel("Encrypted Folder:"), 1, 0)
         layout.addWidget(self.cipher_dir_combo, 1, 1)
@@ -1000,9 +1357,7 @@ class CreateVolumePage(QWizardPage):
         browse_cipher.clicked.connect(self.browse_cipher)
         layout.addWidget(browse_cipher, 1, 2)
 
-        self.mount_point_combo = QComboBox()
-        self.mount_point_combo.setEditable(True)
-        self.mount_point_combo.addItems([os.path.expanduser("~/Secure"), os.path.expanduser("~/Private")])
+        self.mount_point_combo = _make_path_combo(DEFAULT_MOUNT_POINTS)
         self.mount_point_combo.setToolTip("Recommended location for the decrypted view.")
         layout.addWidget(QLabel("Mount Point:"), 2, 0)
         layout.addWidget(self.mount_point_combo, 2, 1)
@@ -1026,12 +1381,12 @@ class CreateVolumePage(QWizardPage):
         self.mount_point_combo.currentTextChanged.connect(self.completeChanged.emit)
 
     def browse_cipher(self):
-        path = QFileDialog.getExistingDirectory(self, "Select Encrypted Folder")
+        path = QFileDialog.getExistingDirectory(self, "Select Encrypted Folder", "", DIRECTORY_DIALOG_OPTIONS)
         if path:
             self.cipher_dir_combo.setCurrentText(path)
 
     def browse_mount(self):
-        path = QFileDialog.getExistingDirectory(self, "Select Mount Point")
+        path = QFileDialog.getExistingDirectory(self, "Select Mount Point", "", DIRECTORY_DIALOG_OPTIONS)
         if path:
             self.mount_point_combo.setCurrentText(path)
 
@@ -1080,26 +1435,60 @@ class SuccessPage(QWizardPage):
             "Mithril will now launch the main interface."
         )
 
+class _MountBatch:
+    """Mounts started together with one password (Mount All).
+
+    A wrong password fails every mount in the batch; the volumes are collected
+    here so the user is asked again once, after the last one has finished.
+    """
+    def __init__(self):
+        # True while the mounts are still being started; dialogs opened meanwhile spin
+        # nested event loops in which earlier mounts can already finish.
+        self.starting = True
+        self.running = set()
+        self.wrong_password = []
+
+
 class MainWindow(QMainWindow):
+    # Emitted from a pool thread when a USB volume's storage is present: (volume_id, profile_name).
+    _usb_volume_present = pyqtSignal(str, str)
+    # Emitted from a pool thread when a secure delete ends: (volume_id, label, error or "").
+    _volume_deleted = pyqtSignal(str, str, str)
+    # Emitted from a pool thread once a new volume's directories exist: (data, profile_name, mount, error or "").
+    _volume_dirs_ready = pyqtSignal(object, str, bool, str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("gocryptfs Manager")
         # Set application icon from bundled icons
         # A check for the existence of the icon file
-        if sys.platform.startswith("win"):
-            icon_path = os.path.join(ICONS_DIR, "mithril.ico")
-        else:
-            icon_path = os.path.join(ICONS_DIR, "icon_256.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if os.path.exists(os.path.join(ICONS_DIR, APP_ICON_FILE)):
+            self.setWindowIcon(app_icon())
         self.setMinimumSize(QSize(700, 500))
+        # The one QSettings instance for the app; dialogs get it passed in.
         self.settings = QSettings(ORGANIZATION_NAME, APPLICATION_NAME)
-        self.terminal_manager = TerminalManager(self.settings, default_workdir=os.path.expanduser("~"))
-
-        self.cached_password = None
+        # Let Qt batch setValue() calls and flush them together on the way out.
+        QApplication.instance().aboutToQuit.connect(self.settings.sync)
+        self.terminal_manager = TerminalManager(self.settings, default_workdir=HOME_DIR)
+
+        self.password_cache = PasswordCache()
+        self._password_cache_timer = QTimer(self)
+        self._password_cache_timer.setSingleShot(True)
+        self._password_cache_timer.timeout.connect(self.clear_cached_password)
         self.profiles = {}
+        self._saved_profiles_data = None
+        # id -> volume dict across all profiles; rebuilt lazily after structural changes.
+        self._volume_index = None
+        self._error_dialog = None
+        # Result of pinned_volumes(); rebuilt lazily when volumes or their pin state change.
+        self._pinned_index = None
+        # Keep running QProcess objects referenced until they finish.
+        self._running_processes = set()
+        # volume id -> the gocryptfs/umount process currently working on that volume
+        # (None while in-process work such as a secure delete is running).
+        self._volume_processes = {}
         self.current_profile_name = "Default"
-        self.mounted_paths = set()
+        self.mounted_paths = frozenset()
         self.terminal_visible = self.terminal_manager.visible
         self.has_shown_tray_message = False
         self.is_quitting = False
@@ -1110,6 +1499,29 @@ class MainWindow(QMainWindow):
         self.terminal_panel.setMaximumHeight(initial_height)
         self.terminal_container = self.terminal_panel
 
+        # One animation object is reused for every show/hide of the terminal.
+        self._terminal_animation = QPropertyAnimation(self.terminal_container, b"maximumHeight", self)
+        self._terminal_animation.setDuration(250)
+        self._terminal_animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
+
+        # Queued back to the GUI thread, so mounting happens here, not on the pool thread.
+        self._usb_volume_present.connect(self.mount_volume)
+        self._volume_deleted.connect(self._on_volume_deleted)
+        self._volume_dirs_ready.connect(self._on_volume_dirs_ready)
+
+        # Volume edits are written to disk after a short pause rather than one write per edit.
+        self._profile_save_timer = QTimer(self)
+        self._profile_save_timer.setSingleShot(True)
+        self._profile_save_timer.setInterval(500)
+        self._profile_save_timer.timeout.connect(self._write_profiles)
+        QApplication.instance().aboutToQuit.connect(self.flush_profile_save)
+
+        # Several mounts finishing together (automount, mount all) update the tray once.
+        self._tray_refresh_timer = QTimer(self)
+        self._tray_refresh_timer.setSingleShot(True)
+        self._tray_refresh_timer.setInterval(50)
+        self._tray_refresh_timer.timeout.connect(self._do_update_tray_menu)
+
         self._setup_main_widgets()
         self._create_actions()
         self._create_menus()
@@ -1119,6 +1531,13 @@ class MainWindow(QMainWindow):
         self.load_profiles()
         self.update_mounted_list()
 
+        # Coalesce bursts of mount table changes into a single refresh.
+        self._mount_refresh_timer = QTimer(self)
+        self._mount_refresh_timer.setSingleShot(True)
+        self._mount_refresh_timer.setInterval(100)
+        self._mount_refresh_timer.timeout.connect(self.update_mounted_list)
+        self._watch_mount_table()
+
         # Set initial icon based on saved setting
         self.update_tray_icon_color(self.settings.value("use_monochrome_icon", False, type=bool))
 
@@ -1185,9 +1604,9 @@ class MainWindow(QMainWindow):
         help_menu.addAction(self.rerun_wizard_action)
 
     def show_security_guide(self):
+        # Dialogs are kept after closing and reused on the next open.
         if not hasattr(self, "_security_guide_dialog") or self._security_guide_dialog is None:
             self._security_guide_dialog = SecurityGuideDialog(self)
-            self._security_guide_dialog.finished.connect(lambda: setattr(self, "_security_guide_dialog", None))
         
         if self._security_guide_dialog.isVisible():
             self._security_guide_dialog.hide()
@@ -1198,7 +1617,6 @@ class MainWindow(QMainWindow):
     def show_shortcuts_guide(self):
         if not hasattr(self, "_shortcuts_dialog") or self._shortcuts_dialog is None:
             self._shortcuts_dialog = ShortcutsDialog(self)
-            self._shortcuts_dialog.finished.connect(lambda: setattr(self, "_shortcuts_dialog", None))
 
         if self._shortcuts_dialog.isVisible():
             self._shortcuts_dialog.hide()
@@ -1208,8 +1626,7 @@ class MainWindow(QMainWindow):
 
     def show_preferences(self):
         if not hasattr(self, "_preferences_dialog") or self._preferences_dialog is None:
-            self._preferences_dialog = PreferencesDialog(self)
-            self._preferences_dialog.finished.connect(lambda: setattr(self, "_preferences_dialog", None))
+            self._preferences_dialog = PreferencesDialog(self.settings, self)
         
         if self._preferences_dialog.isVisible():
             self._preferences_dialog.hide()
@@ -1247,20 +1664,10 @@ class MainWindow(QMainWindow):
 
         self._setup_wizard = MithrilSetupWizard(self)
         if self._setup_wizard.exec() == QDialog.DialogCode.Accepted:
-            volume_data = {
-                "label": self._setup_wizard.field("volumeLabel"),
-                "cipher_dir": self._setup_wizard.field("cipherDir"),
-                "mount_point": self._setup_wizard.field("mountPoint"),
-                "apply_perms": self._setup_wizard.field("applyPerms"),
-                "auto_open_mount": self._setup_wizard.field("openFolder"),
-                "automount_on_startup": False, # Default for new volumes
-                "volume_type": "standard", # Default for new volumes
-                "pin_to_tray": False, # Default for new volumes
-            }
-
             # Switch to default profile to add the new volume
-            self.simplified_view.profile_combo.setCurrentText("Default")
-            self.add_volume_to_profile(volume_data)
+            self.simplified_view.select_profile("Default")
+            self.add_volume_to_profile(self._setup_wizard.volume_data(),
+                                       mount=self._setup_wizard.field("mountNow"))
 
     def _create_status_bar(self):
         self.statusBar().showMessage("Ready", 3000)
@@ -1268,57 +1675,17 @@ class MainWindow(QMainWindow):
     def _create_tray_icon(self):
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_menu = QMenu()
+        self._build_tray_menu()
         self.tray_icon.setContextMenu(self.tray_menu)
         self.tray_icon.show()
         self.tray_icon.activated.connect(self.on_tray_activated)
 
-    def update_tray_icon_color(self, use_monochrome):
-        if use_monochrome:
-            source_pixmap = QPixmap(os.path.join(ICONS_DIR, "mithril.png"))
-            mask = source_pixmap.mask()
-            monochrome_pixmap = QPixmap(source_pixmap.size())
-            monochrome_pixmap.fill(Qt.GlobalColor.white)
-            monochrome_pixmap.setMask(mask)
-            tray_icon = QIcon(monochrome_pixmap)
-        else:
-            if sys.platform.startswith("win"):
-                icon_path = os.path.join(ICONS_DIR, "mithril.ico")
-            else:
-                icon_path = os.path.join(ICONS_DIR, "icon_256.png")
-            tray_icon = QIcon(icon_path)
-        
-        self.tray_icon.setIcon(tray_icon)
-        self.settings.setValue("use_monochrome_icon", use_monochrome)
-
-    def on_tray_activated(self, reason):
-        if reason == QSystemTrayIcon.ActivationReason.Trigger: # Left-click
-            self.toggle_window_visibility()
-
-    def toggle_window_visibility(self):
-        if self.isVisible():
-            self.hide()
-        else:
-            self.show()
-            self.activateWindow()
-
-    def update_tray_menu(self):
-        self.tray_menu.clear()
-
-        # --- Pinned Volumes ---
-        has_pinned_volumes = False
-        for profile_name, profile_data in self.profiles.items():
-            for i, vol in enumerate(profile_data.get("volumes", [])):
-                if vol.get("pin_to_tray"):
-                    has_pinned_volumes = True
-                    label = vol.get('label', f"Volume {i+1}")
-                    is_mounted = vol.get('mount_point') in self.mounted_paths
-                    icon = QIcon.fromTheme("media-eject" if is_mounted else "folder-blue")
-                    action = QAction(icon, label, self)
-                    action.triggered.connect(lambda checked, vol_id=i, p_name=profile_name: self.toggle_mount_from_tray(vol_id, p_name))
-                    self.tray_menu.addAction(action)
-        
-        if has_pinned_volumes:
-            self.tray_menu.addSeparator()
+    def _build_tray_menu(self):
+        """Create the static tray actions once; pinned volumes are inserted above them."""
+        # Pinned volume actions keyed by (profile name, volume id), in menu order.
+        self._tray_volume_actions = {}
+        self._tray_pinned_separator = self.tray_menu.addSeparator()
+        self._tray_pinned_separator.setVisible(False)
 
         # --- Application Actions ---
         self.tray_menu.addAction("Clear Cached Password", self.clear_cached_password)
@@ -1336,33 +1703,92 @@ class MainWindow(QMainWindow):
         self.tray_menu.addAction(show_hide_action)
         self.tray_menu.addAction(self.quit_action)
 
+    def update_tray_icon_color(self, use_monochrome):
+        self.tray_icon.setIcon(monochrome_tray_icon() if use_monochrome else app_icon())
+        self.settings.setValue("use_monochrome_icon", use_monochrome)
+
+    def on_tray_activated(self, reason):
+        if reason == QSystemTrayIcon.ActivationReason.Trigger: # Left-click
+            self.toggle_window_visibility()
+
+    def toggle_window_visibility(self):
+        if self.isVisible():
+            self.hide()
+        else:
+            self.show()
+            self.activateWindow()
+
+    def update_tray_menu(self):
+        self._tray_refresh_timer.start()
+
+    def _do_update_tray_menu(self):
+        if self._pinned_index is None:
+            self._pinned_index = pinned_volumes(self.profiles)
+        mounted_paths = self.mounted_paths
+        pinned_entries = [
+            (profile_name, vol["id"], vol.get('label', f"Volume {index+1}"), vol.get('mount_point') in mounted_paths)
+            for profile_name, index, vol in self._pinned_index
+        ]
+        cached = self._tray_volume_actions
+        keys = [(profile_name, volume_id) for profile_name, volume_id, _, _ in pinned_entries]
+
+        # Only add/remove actions when the set or order of pinned volumes changed.
+        if keys != list(cached):
+            for action in cached.values():
+                self.tray_menu.removeAction(action)
+            actions = {}
+            for key in keys:
+                action = cached.pop(key, None)
+                if action is None:
+                    action = QAction(self)
+                    profile_name, volume_id = key
+                    action.triggered.connect(functools.partial(self.toggle_mount_from_tray, volume_id, profile_name))
+                self.tray_menu.insertAction(self._tray_pinned_separator, action)
+                actions[key] = action
+            for action in cached.values():
+                action.deleteLater()
+            self._tray_volume_actions = cached = actions
+            self._tray_pinned_separator.setVisible(bool(actions))
+
+        for profile_name, volume_id, label, is_mounted in pinned_entries:
+            action = cached[(profile_name, volume_id)]
+            if action.text() != label:
+                action.setText(label)
+            action.setIcon(themed_icon("media-eject" if is_mounted else "folder-blue"))
+
     def toggle_mount_from_tray(self, volume_id, profile_name):
-        volume = self.profiles[profile_name]["volumes"][volume_id]
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
         if volume['mount_point'] in self.mounted_paths:
             self.unmount_volume(volume_id, profile_name)
         else:
             self.mount_volume(volume_id, profile_name)
 
-    def run_gocryptfs_command(self, command, needs_password=False, success_message="", on_success=None, on_success_args=(), is_init=False, volume_id=None, profile_name=None):
-        # Accept both list and string forms but prefer explicit argument arrays to avoid injection issues.
-        command_args = command if isinstance(command, list) else shlex.split(command)
-        command_display = command if isinstance(command, str) else shlex.join(command_args)
-
+    def run_gocryptfs_command(self, command_args, needs_password=False, success_message="", on_success=None, on_success_args=(), is_init=False, volume_id=None, profile_name=None, password=None, batch=None):
+        # command_args is an explicit argv list; it is never passed through a shell or re-split.
         if not command_args:
             QMessageBox.warning(self, "Command Error", "No command provided for gocryptfs operation.")
             return
 
         executable = command_args[0]
-        if not can_exec(executable):
+        executable_path = resolve_executable(executable)
+        if executable_path is None:
             self.statusBar().showMessage(f"Required binary '{executable}' was not found. Please install it and retry.", 6000)
             QMessageBox.warning(self, "Command Not Found", f"The command '{executable}' is required but was not found in PATH.")
             return
 
+        if volume_id is not None and volume_id in self._volume_processes:
+            self.statusBar().showMessage("An operation on this volume is already in progress.", 4000)
+            return
+
         safe_echo = format_cmd_for_echo(command_args)
         self.write_to_terminal(safe_echo)
 
-        password = None
-        if needs_password:
+        # A password supplied by the caller (e.g. a mount-all batch) skips the prompt;
+        # the caller then owns that buffer and wipes it.
+        owns_password = needs_password and password is None
+        if owns_password:
             if is_init:
                 pwd_dialog = PasswordDialog(self)
                 if pwd_dialog.exec() == QDialog.DialogCode.Accepted:
@@ -1370,127 +1796,249 @@ class MainWindow(QMainWindow):
                     if not password_str:
                         QMessageBox.warning(self, "Password Mismatch", "The passwords do not match.")
                         return
-                    password = password_str.encode('utf-8')
+                    password = bytearray(password_str, 'utf-8')
                 else:
                     self.statusBar().showMessage("Initialization cancelled.", 3000)
                     return
             else:
-                if self.cached_password:
-                    password = self.cached_password.encode('utf-8')
+                if self.password_cache:
+                    password = self.password_cache.reveal()
                 else:
                     dialog = MountPasswordDialog(self)
                     if dialog.exec() == QDialog.DialogCode.Accepted:
                         password_str = dialog.get_password()
-                        password = password_str.encode('utf-8')
+                        password = bytearray(password_str, 'utf-8')
                         if dialog.should_remember():
-                            self.cached_password = password_str
+                            self.remember_password(password_str)
                     else:
                         self.statusBar().showMessage("Operation cancelled.", 3000)
                         return
 
-        try:
-            result = subprocess.run(
-                command_args, input=password, capture_output=True, check=False
+        # Run asynchronously so slow key derivation does not freeze the event loop.
+        process = QProcess(self)
+        # Absolute path, so Qt does not search PATH again.
+        process.setProgram(executable_path)
+        process.setArguments(command_args[1:])
+        # The signal's own arguments are appended after the bound context.
+        process.finished.connect(functools.partial(
+            self._on_gocryptfs_finished,
+            process, success_message, on_success, on_success_args, volume_id, profile_name, batch,
+        ))
+        process.errorOccurred.connect(functools.partial(self._on_gocryptfs_error, process, volume_id, batch))
+        self._running_processes.add(process)
+        if volume_id is not None:
+            self._volume_processes[volume_id] = process
+        # Registered before start(): a synchronous failed start reports through errorOccurred right away.
+        if batch is not None:
+            batch.running.add(volume_id)
+        process.start()
+        if password is not None:
+            process.write(password)
+            if owns_password:
+                # QProcess has buffered its own copy; drop ours right away.
+                wipe(password)
+        process.closeWriteChannel()
+
+    def _on_gocryptfs_finished(self, process, success_message, on_success, on_success_args, volume_id, profile_name, batch, exit_code, exit_status):
+        self._running_processes.discard(process)
+        self._volume_processes.pop(volume_id, None)
+        if batch is not None:
+            batch.running.discard(volume_id)
+        stderr_bytes = bytes(process.readAllStandardError())
+        process.deleteLater()
+
+        if exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+            self.statusBar().showMessage(success_message, 5000)
+            self.tray_icon.showMessage(
+                "Success",
+                success_message,
+                QSystemTrayIcon.MessageIcon.Information,
+                3000,
             )
+            if on_success:
+                on_success(*on_success_args)
+            self._settle_mount_batch(batch)
+            return
 
-            if result.returncode == 0:
-                self.statusBar().showMessage(success_message, 5000)
-                self.tray_icon.showMessage(
-                    "Success",
-                    success_message,
-                    QSystemTrayIcon.MessageIcon.Information,
-                    3000,
-                )
-                if on_success:
-                    on_success(*on_success_args)
-            else:
-                stderr_bytes = result.stderr or b""
-                try:
-                    error_output = stderr_bytes.decode('utf-8', errors="ignore").strip()
-                except AttributeError:
-                    error_output = str(stderr_bytes).strip()
-                # --- Better Password Handling ---
-                if "password incorrect" in error_output.lower() and volume_id is not None:
-                    self.cached_password = None # Clear incorrect cached password
-                    dialog = MountPasswordDialog(self, show_error=True)
-                    if dialog.exec() == QDialog.DialogCode.Accepted:
-                        # Retry mounting with the new password
-                        self.mount_volume(volume_id, profile_name)
-                    return # Stop further error processing
-
-                error_msg = f"Error executing command (Code: {result.returncode})"
-                self.statusBar().showMessage(error_msg, 8000)
-                error_dialog = ErrorDialog(error_msg, error_output, self)
-                error_dialog.exec()
+        error_output = stderr_bytes.decode('utf-8', errors="ignore").strip()
+        # --- Better Password Handling ---
+        if "password incorrect" in error_output.lower() and volume_id is not None:
+            self.password_cache.clear() # Clear incorrect cached password
+            if batch is not None:
+                # The rest of the batch failed the same way; ask once when it is done.
+                batch.wrong_password.append(volume_id)
+                self._settle_mount_batch(batch)
+                return
+            accepted, password = self._ask_mount_password(show_error=True)
+            if accepted:
+                # Retry mounting with the new password
+                self.mount_volume(volume_id, profile_name, password=password)
+                wipe(password)
+            return # Stop further error processing
+
+        error_msg = f"Error executing command (Code: {exit_code})"
+        self.statusBar().showMessage(error_msg, 8000)
+        self._settle_mount_batch(batch)
+        self.show_error(error_msg, error_output)
+
+    def _ask_mount_password(self, show_error=False):
+        """Prompt for a mount password; returns (accepted, password).
+
+        password is None when the user chose to remember it (mounts then read the
+        cache); otherwise it is a buffer the caller must wipe().
+        """
+        dialog = MountPasswordDialog(self, show_error=show_error)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            self.statusBar().showMessage("Operation cancelled.", 3000)
+            return False, None
+        password_str = dialog.get_password()
+        if dialog.should_remember():
+            self.remember_password(password_str)
+            return True, None
+        return True, bytearray(password_str, 'utf-8')
+
+    def _start_mount_batch(self, volume_ids, password):
+        batch = _MountBatch()
+        # Each mount writes the password synchronously, so it can be wiped once all are started.
+        for volume_id in volume_ids:
+            self.mount_volume(volume_id, password=password, batch=batch)
+        wipe(password)
+        batch.starting = False
+        self._settle_mount_batch(batch)
+
+    def _settle_mount_batch(self, batch):
+        # Once nothing in the batch is still running, retry its wrong-password
+        # failures together after a single prompt.
+        if batch is None or batch.starting or batch.running or not batch.wrong_password:
+            return
+        volume_ids, batch.wrong_password = batch.wrong_password, []
+        accepted, password = self._ask_mount_password(show_error=True)
+        if accepted:
+            self._start_mount_batch(volume_ids, password)
+
+    def show_error(self, message, details):
+        # One dialog is reused for every failure; errors arriving while it is open are appended.
+        if self._error_dialog is None:
+            self._error_dialog = ErrorDialog(parent=self)
+        if self._error_dialog.isVisible():
+            self._error_dialog.append_content(message, details)
+            return
+        self._error_dialog.set_content(message, details)
+        self._error_dialog.exec()
 
-        except FileNotFoundError as e:
-            QMessageBox.critical(self, "Command Not Found", f"Could not execute '{command_args[0]}': {e}")
-        except Exception as e:
-            QMessageBox.critical(self, "Unexpected Error", f"An unexpected error occurred: {e}")
+    def _on_gocryptfs_error(self, process, volume_id, batch, error):
+        # Only a failed start needs handling here; every other error is followed by finished().
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        self._running_processes.discard(process)
+        self._volume_processes.pop(volume_id, None)
+        if batch is not None:
+            batch.running.discard(volume_id)
+        # The remembered path may have gone away (e.g. package removed); look it up afresh next time.
+        _EXECUTABLE_PATHS.clear()
+        QMessageBox.critical(self, "Command Not Found", f"Could not execute '{process.program()}': {process.errorString()}")
+        process.deleteLater()
+        self._settle_mount_batch(batch)
 
     def automount_volumes(self):
         """Iterate through all profiles and automount volumes."""
         for profile_name, profile_data in self.profiles.items():
-            for i, volume in enumerate(profile_data.get("volumes", [])):
+            for volume in profile_data.get("volumes", []):
                 # Standard automount on startup
                 if volume.get("automount_on_startup"):
-                    self.mount_volume(i, profile_name=profile_name)
+                    self.mount_volume(volume["id"], profile_name=profile_name)
                 
-                # USB automount (check if path exists)
-                elif volume.get("volume_type") == "usb" and os.path.exists(volume.get("cipher_dir", "")):
-                    self.mount_volume(i, profile_name=profile_name)
+                # USB automount (check if path exists). The check can stall for seconds on
+                # slow or half-attached media, so it runs off the GUI thread and all
+                # volumes are probed in parallel.
+                elif volume.get("volume_type") == "usb":
+                    QThreadPool.globalInstance().start(functools.partial(
+                        self._probe_usb_volume, volume["id"], profile_name, volume.get("cipher_dir", "")
+                    ))
+
+    def _probe_usb_volume(self, volume_id, profile_name, cipher_dir):
+        # Runs on a QThreadPool thread; only touches the filesystem and emits.
+        if os.path.exists(cipher_dir):
+            self._usb_volume_present.emit(volume_id, profile_name)
 
     def open_folder(self, path):
         """Opens the specified path in the default file manager."""
-        try:
-            subprocess.run(['xdg-open', path], check=True)
-        except Exception as e:
-            self.statusBar().showMessage(f"Failed to open folder: {e}", 5000)
+        # Qt's desktop integration (portal/DBus) avoids spawning xdg-open and waiting on it.
+        if not path or not QDesktopServices.openUrl(QUrl.fromLocalFile(path)):
+            self.statusBar().showMessage(f"Failed to open folder: {path}", 5000)
 
     # --- Core Logic ---
+    def _watch_mount_table(self):
+        """Refresh mount state whenever the kernel reports a mount table change."""
+        self._mounts_notifier = None
+        try:
+            self._mounts_fd = os.open(MOUNTINFO_PATH, os.O_RDONLY)
+        except OSError:
+            # No procfs; mount state is refreshed after our own mount/unmount calls only.
+            return
+        # mountinfo signals POLLPRI on every change, which Qt reports as an exception event.
+        self._mounts_notifier = QSocketNotifier(self._mounts_fd, QSocketNotifier.Type.Exception, self)
+        self._mounts_notifier.activated.connect(self.schedule_mount_refresh)
+
+    def schedule_mount_refresh(self, *_):
+        self._mount_refresh_timer.start()
+
     def update_mounted_list(self):
         """Checks system mounts and updates the UI accordingly."""
-        self.mounted_paths.clear()
+        mounted = set()
         try:
-            result = subprocess.run(['mount'], capture_output=True, text=True, check=True)
-            for line in result.stdout.splitlines():
-                if 'fuse.gocryptfs' in line:
-                    mount_point = line.split(' on ')[1].split(' type ')[0]
-                    self.mounted_paths.add(mount_point)
+            if os.path.exists(MOUNTINFO_PATH):
+                with open(MOUNTINFO_PATH, 'rb') as f:
+                    mounted = parse_mountinfo(f.read())
+            else:
+                # No procfs (e.g. macOS); fall back to parsing mount(8) output.
+                # Scan the raw bytes; only matched mount points get decoded.
+                # Imported here: Linux reads procfs and never needs it.
+                import subprocess
+                result = subprocess.run(['mount'], capture_output=True, check=True)
+                mounted = {os.fsdecode(m.group(1)) for m in _MOUNT_OUTPUT_RE.finditer(result.stdout)}
         except Exception as e:
             self.statusBar().showMessage(f"Could not check mounts: {e}", 5000)
+        # Readers only ever see a complete, immutable snapshot.
+        self.mounted_paths = frozenset(mounted)
 
         self.refresh_volumes_list()
         self.update_tray_menu()
 
     def refresh_volumes_list(self):
         """Repopulates the favorite volumes list from the current profile."""
-        self.simplified_view.volumes_list.clear()
-        profile = self.profiles.get(self.current_profile_name, {})
-        volumes = profile.get("volumes", [])
-        for i, vol in enumerate(volumes):
-            is_mounted = vol.get('mount_point') in self.mounted_paths
-            icon = QIcon.fromTheme("emblem-ok" if is_mounted else "emblem-symbolic-link")
-            item = QListWidgetItem(icon, f" {vol.get('label', 'Unnamed Volume')}")
-            item.setToolTip(f"Mount Point: {vol.get('mount_point')}")
-            item.setData(Qt.ItemDataRole.UserRole, i) # Store index as ID
-            self.simplified_view.volumes_list.addItem(item)
-
-    def on_volume_selected(self):
+        mounted_paths = self.mounted_paths
+        # The model compares against what it already shows and only updates the difference.
+        self.simplified_view.volumes_model.set_rows(
+            (vol["id"], vol.get('label', 'Unnamed Volume'), vol.get('mount_point'), vol.get('mount_point') in mounted_paths)
+            for vol in self._current_volumes()
+        )
+
+    def on_volume_selected(self, *_):
         volume_id = self.simplified_view.get_selected_volume_id()
         self.simplified_view.load_flags_for_volume(volume_id)
 
-    def mount_volume(self, volume_id, profile_name=None, auto_open=None):
+    def mount_volume(self, volume_id, profile_name=None, auto_open=None, password=None, batch=None):
         # If profile_name is not provided, use the current one.
         if profile_name is None:
             profile_name = self.current_profile_name
             
-        volume = self.profiles[profile_name]["volumes"][volume_id]
+        # Mount with the flags as currently typed, not as last saved.
+        self.simplified_view.flush_pending_flags()
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
         cipher_dir, mount_point = volume["cipher_dir"], volume["mount_point"]
+        if volume_id in self._volume_processes:
+            self.statusBar().showMessage("An operation on this volume is already in progress.", 4000)
+            return
 
-        # --- Attempt to unmount first to fix automount issues ---
-        # This is non-blocking and we ignore the result. It's to clear stale mounts.
-        subprocess.run(['umount', mount_point], capture_output=True)
+        # --- Clear a stale mount first to fix automount issues ---
+        # Only a path the kernel still lists can be stale; unmount it in the background
+        # and continue once it is gone. The result is ignored.
+        if mount_point in self.mounted_paths:
+            self._unmount_stale(volume_id, mount_point, profile_name, auto_open, password, batch)
+            return
 
         # --- Intelligent Directory Check ---
         if not os.path.isdir(cipher_dir) or not os.path.isdir(mount_point):
@@ -1513,7 +2061,7 @@ class MainWindow(QMainWindow):
                 return
 
         # --- Initialization Check ---
-        is_new_volume = not os.path.exists(os.path.join(cipher_dir, "gocryptfs.conf"))
+        is_new_volume = not is_gocryptfs_initialized(cipher_dir)
         if is_new_volume:
             init_command = ["gocryptfs", "-init", cipher_dir]
             # After successful initialization, recursively call mount_volume to mount it
@@ -1529,7 +2077,7 @@ class MainWindow(QMainWindow):
             )
             return # Stop here, the recursive call will handle mounting
 
-        if not os.access(mount_point, os.W_OK) or os.listdir(mount_point):
+        if not os.access(mount_point, os.W_OK) or _dir_has_entries(mount_point):
             QMessageBox.warning(self, "Mount Error", "Mount point must be an empty, writable directory.")
             return
 
@@ -1545,7 +2093,8 @@ class MainWindow(QMainWindow):
 
         command_args = ["gocryptfs", *extra_args, cipher_dir, mount_point]
         
-        on_success_callbacks = [self.update_mounted_list]
+        # Coalesced, so a batch of mounts finishing together re-reads the mount table once.
+        on_success_callbacks = [self.schedule_mount_refresh]
         
         # Determine whether to open the folder. The explicit `auto_open` parameter
         # from the wizard takes precedence over the saved volume setting.
@@ -1564,27 +2113,96 @@ class MainWindow(QMainWindow):
             f"Mounted {volume['label']}", 
             on_mount_success,
             volume_id=volume_id,
-            profile_name=profile_name
+            profile_name=profile_name,
+            password=password,
+            batch=batch
         )
 
-    def unmount_volume(self, volume_id, profile_name=None):
+    def _unmount_stale(self, volume_id, mount_point, profile_name, auto_open, password, batch):
+        # The caller may wipe its password buffer as soon as we return, so keep a copy.
+        held_password = bytearray(password) if password is not None else None
+
+        def continue_mount():
+            # Drop the stale entry so the retry does not take this path again.
+            self.mounted_paths = self.mounted_paths - {mount_point}
+            self.mount_volume(volume_id, profile_name, auto_open, held_password, batch)
+            wipe(held_password)
+            if batch is not None and volume_id not in self._volume_processes:
+                # The mount was not started after all; stop holding the batch open for it.
+                batch.running.discard(volume_id)
+                self._settle_mount_batch(batch)
+            # Re-sync with the kernel in case the unmount did not actually go through.
+            self.schedule_mount_refresh()
+
+        # The batch waits for this volume's deferred mount as if it were already running.
+        if batch is not None:
+            batch.running.add(volume_id)
+        executable_path = resolve_executable("umount")
+        if executable_path is None:
+            # Best effort: without umount, let the mount attempt report the problem.
+            self.statusBar().showMessage("Could not clear a stale mount: 'umount' was not found.", 6000)
+            continue_mount()
+            return
+
+        process = QProcess(self)
+
+        def on_finished(*_):
+            self._running_processes.discard(process)
+            self._volume_processes.pop(volume_id, None)
+            process.deleteLater()
+            continue_mount()
+
+        def on_error(error):
+            if error == QProcess.ProcessError.FailedToStart:
+                # The remembered path may have gone away; look it up afresh next time.
+                _EXECUTABLE_PATHS.clear()
+                on_finished()
+
+        process.finished.connect(on_finished)
+        process.errorOccurred.connect(on_error)
+        self._running_processes.add(process)
+        self._volume_processes[volume_id] = process
+        # Absolute path, like run_gocryptfs_command.
+        process.setProgram(executable_path)
+        process.setArguments([mount_point])
+        process.start()
+
+    def unmount_volume(self, volume_id, profile_name=None, on_success=None):
         if profile_name is None:
             profile_name = self.current_profile_name
-        volume = self.profiles[profile_name]["volumes"][volume_id]
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
+
+        def on_unmount_success():
+            self.schedule_mount_refresh()
+            if on_success:
+                on_success()
+
         self.run_gocryptfs_command(
             ["umount", volume["mount_point"]],
-            False, f"Unmounted {volume['label']}", self.update_mounted_list
+            False, f"Unmounted {volume['label']}", on_unmount_success,
+            volume_id=volume_id,
         )
 
     def mount_all_volumes(self):
-        for i, vol in enumerate(self.profiles[self.current_profile_name]["volumes"]):
-            if vol['mount_point'] not in self.mounted_paths:
-                self.mount_volume(i)
+        volumes = self._current_volumes()
+        pending = [vol["id"] for vol in volumes if vol['mount_point'] not in self.mounted_paths]
+        if not pending:
+            return
+
+        # Prompt once for the whole batch; the mounts then run concurrently.
+        password = None
+        if not self.password_cache:
+            accepted, password = self._ask_mount_password()
+            if not accepted:
+                return
+        self._start_mount_batch(pending, password)
 
     def unmount_all_volumes(self):
-        for i, vol in enumerate(self.profiles[self.current_profile_name]["volumes"]):
+        for vol in self._current_volumes():
             if vol['mount_point'] in self.mounted_paths:
-                self.unmount_volume(i)
+                self.unmount_volume(vol["id"])
 
     # --- Profile Management ---
     def new_profile(self):
@@ -1595,7 +2213,7 @@ class MainWindow(QMainWindow):
                 return
             self.profiles[text] = {"volumes": []}
             self.simplified_view.profile_combo.addItem(text)
-            self.simplified_view.profile_combo.setCurrentText(text)
+            self.simplified_view.select_profile(text)
             self.save_current_profile()
 
     def rename_profile(self):
@@ -1610,11 +2228,12 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Profile Exists", "A profile with this name already exists.")
                 return
             self.profiles[text] = self.profiles.pop(old_name)
+            self._volumes_changed()
             self.current_profile_name = text
             self.simplified_view.profile_combo.blockSignals(True)
             self.simplified_view.profile_combo.removeItem(self.simplified_view.profile_combo.findText(old_name))
             self.simplified_view.profile_combo.addItem(text)
-            self.simplified_view.profile_combo.setCurrentText(text)
+            self.simplified_view.select_profile(text)
             self.simplified_view.profile_combo.blockSignals(False)
             self.save_current_profile()
 
@@ -1627,69 +2246,105 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(self, "Confirm Delete", f"Are you sure you want to delete the profile '{profile_name}'?")
         if reply == QMessageBox.StandardButton.Yes:
             del self.profiles[profile_name]
+            self._volumes_changed()
             self.simplified_view.profile_combo.removeItem(self.simplified_view.profile_combo.findText(profile_name))
-            self.simplified_view.profile_combo.setCurrentText("Default")
+            self.simplified_view.select_profile("Default")
             self.save_current_profile()
 
     def load_profiles(self):
-        os.makedirs(os.path.dirname(PROFILES_FILE), exist_ok=True)
         try:
-            with open(PROFILES_FILE, 'r') as f:
-                self.profiles = json.load(f)
+            with open(PROFILES_FILE, 'rb') as f:
+                data = f.read()
+            self.profiles = parse_profiles(data)
+            self._saved_profiles_data = data
         except (FileNotFoundError, json.JSONDecodeError):
             self.profiles = {"Default": {"volumes": []}}
         
         if "Default" not in self.profiles:
             self.profiles["Default"] = {"volumes": []}
+        ensure_volume_ids(self.profiles)
+        self._volumes_changed()
 
         combo = self.simplified_view.profile_combo
+        self.current_profile_name = self.settings.value("last_profile", "Default")
+        if self.current_profile_name not in self.profiles:
+            self.current_profile_name = "Default"
+
         combo.blockSignals(True)
         combo.clear()
         combo.addItems(self.profiles.keys())
+        self.simplified_view.select_profile(self.current_profile_name)
         combo.blockSignals(False)
 
-        self.current_profile_name = self.settings.value("last_profile", "Default")
-        if self.current_profile_name not in self.profiles:
-            self.current_profile_name = "Default"
-        combo.setCurrentText(self.current_profile_name)
+    def schedule_profile_save(self):
+        """Write profiles.json shortly; a burst of edits collapses into one write."""
+        self._profile_save_timer.start()
+
+    def flush_profile_save(self):
+        if self._profile_save_timer.isActive():
+            self._profile_save_timer.stop()
+            self._write_profiles()
+
+    def _write_profiles(self):
+        try:
+            data = dump_profiles(self.profiles)
+            # Only touch the disk when the serialized profiles actually changed.
+            if data != self._saved_profiles_data:
+                write_file_atomic(PROFILES_FILE, data)
+                self._saved_profiles_data = data
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not save profiles: {e}")
+            self.statusBar().showMessage("Failed to save profile.", 5000)
+            return False
+        return True
 
     def save_current_profile(self):
-        import copy
         profile_name = self.simplified_view.profile_combo.currentText()
         if not profile_name: return
+        # This write covers anything still waiting on the debounce timer.
+        self._profile_save_timer.stop()
+
+        saved_as_new = profile_name != self.current_profile_name
+        if saved_as_new:
+            # Saving under a new name copies the volumes. Volume dicts hold scalars plus a
+            # flat "flags" dict, so cloning those two levels keeps the profiles independent.
+            current_volumes = self._current_volumes()
+            copied_volumes = []
+            for vol in current_volumes:
+                copied = dict(vol, id=new_volume_id())
+                if "flags" in copied:
+                    copied["flags"] = dict(copied["flags"])
+                copied_volumes.append(copied)
+            self.profiles[profile_name] = {"volumes": copied_volumes}
+            self._volumes_changed()
+            self.current_profile_name = profile_name
+        else:
+            self.profiles.setdefault(profile_name, {"volumes": []})
 
-        # Deep copy to prevent accidental modification of the old profile
-        current_volumes = self.profiles.get(self.current_profile_name, {}).get("volumes", [])
-        self.profiles[profile_name] = {"volumes": copy.deepcopy(current_volumes)}
-        self.current_profile_name = profile_name
+        if not self._write_profiles():
+            return
 
-        try:
-            with open(PROFILES_FILE, 'w') as f:
-                json.dump(self.profiles, f, indent=4)
-            
-            # --- Visual Feedback ---
-            save_button = self.simplified_view.save_profile_button
-            original_text = " Save"
-            original_icon = QIcon.fromTheme("document-save")
-
-            save_button.setText(" Saved!")
-            save_button.setIcon(QIcon.fromTheme("emblem-ok"))
-            save_button.setEnabled(False)
-
-            # Revert the button back after 2 seconds
-            QTimer.singleShot(2000, lambda: (
-                save_button.setText(original_text),
-                save_button.setIcon(original_icon),
-                save_button.setEnabled(True)
-            ))
-            # --- End Visual Feedback ---
+        # --- Visual Feedback ---
+        save_button = self.simplified_view.save_profile_button
+        original_text = " Save"
+        original_icon = themed_icon("document-save")
 
-            if self.simplified_view.profile_combo.findText(profile_name) == -1:
-                self.simplified_view.profile_combo.addItem(profile_name)
+        save_button.setText(" Saved!")
+        save_button.setIcon(themed_icon("emblem-ok"))
+        save_button.setEnabled(False)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not save profiles: {e}")
-            self.statusBar().showMessage("Failed to save profile.", 5000)
+        # Revert the button back after 2 seconds
+        QTimer.singleShot(2000, lambda: (
+            save_button.setText(original_text),
+            save_button.setIcon(original_icon),
+            save_button.setEnabled(True)
+        ))
+        # --- End Visual Feedback ---
+
+        # Existing profiles are always listed already; only a save-as can add a name.
+        # (An editable combo may have inserted the typed text itself, hence the lookup.)
+        if saved_as_new and self.simplified_view.profile_combo.findText(profile_name) == -1:
+            self.simplified_view.profile_combo.addItem(profile_name)
 
     def switch_profile(self):
         new_profile = self.simplified_view.profile_combo.currentText()
@@ -1706,69 +2361,131 @@ class MainWindow(QMainWindow):
                 self.profiles[new_profile] = {"volumes": []}
                 self.current_profile_name = new_profile
                 self.save_current_profile()
-                self.simplified_view.refresh_volumes_list()
                 self.statusBar().showMessage(
                     f"Created and switched to new profile '{new_profile}'.", 3000
                 )
             else:
-                self.simplified_view.profile_combo.setCurrentText(self.current_profile_name)
+                # The editable combo has already inserted the typed name; take it back out.
+                combo = self.simplified_view.profile_combo
+                combo.blockSignals(True)
+                combo.removeItem(combo.currentIndex())
+                self.simplified_view.select_profile(self.current_profile_name)
+                combo.blockSignals(False)
+                return
 
-        self.settings.setValue("last_profile", new_profile)
+        self.settings.setValue("last_profile", self.current_profile_name)
         self.update_mounted_list()
 
-    def add_volume_to_profile(self, data):
+    def add_volume_to_profile(self, data, mount=None):
+        """Create the volume's directories in the background, then add and initialize it.
+
+        The volume is mounted after initialization if mount is true; None defers to the
+        "automount on creation" preference. Returns the new volume's id; the volume
+        appears in the profile once its directories exist.
+        """
+        data.setdefault("id", new_volume_id())
+        if mount is None:
+            mount = self.settings.value("automount_on_creation", True, type=bool)
+        # The directories must be created for a new volume; strict permissions only if the user checked the box.
+        # makedirs walks every path component, which can stall on network or removable storage.
+        QThreadPool.globalInstance().start(functools.partial(
+            self._create_volume_dirs, data, self.current_profile_name, bool(mount)
+        ))
+        return data["id"]
+
+    def _create_volume_dirs(self, data, profile_name, mount):
+        # Runs on a QThreadPool thread; reports back through _volume_dirs_ready.
+        apply_perms = bool(data.get("apply_perms"))
         try:
-            cipher_dir, mount_point = data["cipher_dir"], data["mount_point"]
-            
-            # The directories must be created for a new volume, regardless of permissions.
-            os.makedirs(cipher_dir, exist_ok=True)
-            os.makedirs(mount_point, exist_ok=True)
-            
-            # Apply strict permissions only if the user checked the box.
-            if data.get("apply_perms"):
-                os.chmod(cipher_dir, 0o700)
-                os.chmod(mount_point, 0o700)
-                self.statusBar().showMessage("Created directories with recommended permissions.", 3000)
-            else:
-                self.statusBar().showMessage("Created directories.", 3000)
-                
+            ensure_directory(data["cipher_dir"], private=apply_perms)
+            ensure_directory(data["mount_point"], private=apply_perms)
         except Exception as e:
-            QMessageBox.critical(self, "Permissions Error", f"Could not create directories or set permissions: {e}")
-            return None
+            self._volume_dirs_ready.emit(data, profile_name, mount, str(e))
+            return
+        self._volume_dirs_ready.emit(data, profile_name, mount, "")
 
-        profile = self.profiles.setdefault(self.current_profile_name, {"volumes": []})
+    def _on_volume_dirs_ready(self, data, profile_name, mount, error):
+        if error:
+            QMessageBox.critical(self, "Permissions Error", f"Could not create directories or set permissions: {error}")
+            return
+        if data.get("apply_perms"):
+            self.statusBar().showMessage("Created directories with recommended permissions.", 3000)
+        else:
+            self.statusBar().showMessage("Created directories.", 3000)
+
+        profile = self.profiles.setdefault(profile_name, {"volumes": []})
         profile["volumes"].append(data)
+        self._volumes_changed()
         self.refresh_volumes_list()
         self.update_tray_menu()
-        self.save_current_profile()
+        self.schedule_profile_save()
 
-        new_volume_id = len(profile["volumes"]) - 1
-        
-        # --- Post-Creation Actions ---
-        # This callback chain ensures initialization happens before mounting.
-        def mount_if_needed():
-            if self.settings.value("automount_on_creation", True, type=bool):
-                # Use a timer to allow the UI to settle before mounting
-                QTimer.singleShot(200, lambda: self.mount_volume(new_volume_id, auto_open=data.get("auto_open_mount")))
+        volume_id = data["id"]
 
-        self.initialize_new_volume(new_volume_id, on_success=mount_if_needed)
-        
-        return new_volume_id
+        # --- Post-Creation Actions ---
+        # Mount from the init success callback. It runs from the event loop after the init
+        # process has been released, so the volume is no longer busy and no delay is needed.
+        on_success = None
+        if mount:
+            on_success = functools.partial(self.mount_volume, volume_id, auto_open=data.get("auto_open_mount"))
+        self.initialize_new_volume(volume_id, on_success=on_success)
+
+    def _current_volumes(self):
+        """The current profile's volume list (empty if the profile has none)."""
+        return self.profiles.get(self.current_profile_name, {}).get("volumes", [])
+
+    def _volumes_changed(self):
+        """Drop the lookup caches after volumes were added, removed or replaced."""
+        self._volume_index = None
+        self._pinned_index = None
+
+    def get_volume(self, volume_id):
+        """Return the volume with this id from any profile, or None if it no longer exists."""
+        if self._volume_index is None:
+            self._volume_index = {
+                vol["id"]: vol
+                for profile_data in self.profiles.values()
+                for vol in profile_data.get("volumes", [])
+            }
+        return self._volume_index.get(volume_id)
 
     def update_volume_in_profile(self, volume_id, data):
-        self.profiles[self.current_profile_name]["volumes"][volume_id].update(data)
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
+        # Accepting the edit dialog without changes should not rewrite anything.
+        if all(key in volume and volume[key] == value for key, value in data.items()):
+            return
+        volume.update(data)
+        self._pinned_index = None
         self.refresh_volumes_list()
         self.update_tray_menu()
-        self.save_current_profile()
+        self.schedule_profile_save()
+
+    def _profile_name_of(self, volume_id):
+        """Name of the profile holding the volume with this id, or None."""
+        for profile_name, profile_data in self.profiles.items():
+            if any(vol["id"] == volume_id for vol in profile_data.get("volumes", [])):
+                return profile_name
+        return None
 
     def remove_volume_from_profile(self, volume_id):
-        del self.profiles[self.current_profile_name]["volumes"][volume_id]
+        # Look the volume up by id rather than in the current profile: a background
+        # delete can finish after the user has switched to another profile.
+        profile_name = self._profile_name_of(volume_id)
+        if profile_name is None:
+            return
+        volumes = self.profiles[profile_name]["volumes"]
+        volumes[:] = [vol for vol in volumes if vol["id"] != volume_id]
+        self._volumes_changed()
         self.refresh_volumes_list()
         self.update_tray_menu()
-        self.save_current_profile()
+        self.schedule_profile_save()
 
     def secure_delete_volume_from_disk(self, volume_id):
-        volume = self.profiles[self.current_profile_name]["volumes"][volume_id]
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
         cipher_dir = volume.get("cipher_dir")
         mount_point = volume.get("mount_point")
 
@@ -1779,14 +2496,18 @@ class MainWindow(QMainWindow):
         
         # Unmount the volume if it's currently mounted
         if mount_point in self.mounted_paths:
-            self.unmount_volume(volume_id)
-            # Give it a moment to unmount before trying to delete the folder
-            QTimer.singleShot(500, lambda: self._proceed_with_secure_delete(volume_id))
+            # Unmounting is asynchronous; only delete once it has completed.
+            self.unmount_volume(volume_id, on_success=lambda: self._proceed_with_secure_delete(volume_id))
         else:
             self._proceed_with_secure_delete(volume_id)
 
     def _proceed_with_secure_delete(self, volume_id):
-        volume = self.profiles[self.current_profile_name]["volumes"][volume_id]
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
+        if volume_id in self._volume_processes:
+            self.statusBar().showMessage("An operation on this volume is already in progress.", 4000)
+            return
         cipher_dir = volume.get("cipher_dir")
         mount_point = volume.get("mount_point")
 
@@ -1861,6 +2582,7 @@ class MainWindow(QMainWindow):
                 self.statusBar().showMessage("Deletion cancelled.", 3000)
                 return
 
+            trees = []
             for entry in unique_targets:
                 resolved = entry["resolved"]
                 path_obj = entry["path"]
@@ -1874,19 +2596,20 @@ class MainWindow(QMainWindow):
 
                 if resolved.is_dir():
                     self.write_to_terminal(f"Deleting directory tree: {resolved}")
-                    shutil.rmtree(resolved)
+                    trees.append(resolved)
 
+            profile_name = self._profile_name_of(volume_id)
             audit_entries = []
             for entry in unique_targets:
                 status = "deleted_symlink" if entry["is_symlink"] else "deleted_dir"
-                audit_entries.append(f"{status} | profile={self.current_profile_name} | volume={volume.get('label','')} | path={entry['resolved']}")
-            _append_delete_audit(audit_entries)
-
-            self.statusBar().showMessage(f"Successfully deleted '{volume['label']}' and its mount point.", 5000)
-            self.tray_icon.showMessage("Success", f"Securely deleted volume '{volume['label']}'.", QSystemTrayIcon.MessageIcon.Information, 3000)
+                audit_entries.append(f"{status} | profile={profile_name} | volume={volume.get('label','')} | path={entry['resolved']}")
 
-            # After successful deletion, remove it from the profile
-            self.remove_volume_from_profile(volume_id)
+            # Removing a large encrypted tree can take minutes; do it on a pool thread.
+            self._volume_processes[volume_id] = None
+            self.statusBar().showMessage(f"Deleting '{volume['label']}'...")
+            QThreadPool.globalInstance().start(functools.partial(
+                self._delete_volume_trees, volume_id, volume['label'], trees, audit_entries
+            ))
 
         except Exception as e:
             error_msg = f"Failed to delete volume: {e}"
@@ -1895,18 +2618,44 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Deletion Error", error_msg)
             self.statusBar().showMessage("Failed to delete volume.", 5000)
 
+    def _delete_volume_trees(self, volume_id, label, trees, audit_entries):
+        # Runs on a QThreadPool thread; reports back through _volume_deleted.
+        try:
+            for tree in trees:
+                shutil.rmtree(tree)
+        except Exception as e:
+            self._volume_deleted.emit(volume_id, label, str(e))
+            return
+        _append_delete_audit(audit_entries)
+        self._volume_deleted.emit(volume_id, label, "")
+
+    def _on_volume_deleted(self, volume_id, label, error):
+        self._volume_processes.pop(volume_id, None)
+        if error:
+            QMessageBox.critical(self, "Deletion Error", f"Failed to delete volume: {error}")
+            self.statusBar().showMessage("Failed to delete volume.", 5000)
+            return
+
+        self.statusBar().showMessage(f"Successfully deleted '{label}' and its mount point.", 5000)
+        self.tray_icon.showMessage("Success", f"Securely deleted volume '{label}'.", QSystemTrayIcon.MessageIcon.Information, 3000)
+
+        # After successful deletion, remove it from the profile
+        self.remove_volume_from_profile(volume_id)
+
     def toggle_pin_volume(self, volume_id, pin_state):
-        self.profiles[self.current_profile_name]["volumes"][volume_id]["pin_to_tray"] = pin_state
-        self.save_current_profile()
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
+        volume["pin_to_tray"] = pin_state
+        self._pinned_index = None
+        self.schedule_profile_save()
         self.update_tray_menu()
 
     def update_volume_flags(self, volume_id, flags):
-        if self.current_profile_name in self.profiles and \
-           self.profiles[self.current_profile_name].get("volumes") and \
-           volume_id < len(self.profiles[self.current_profile_name]["volumes"]):
-            
-            self.profiles[self.current_profile_name]["volumes"][volume_id]["flags"] = flags
-            self.save_current_profile() # Save changes to flags immediately
+        volume = self.get_volume(volume_id)
+        if volume is not None and volume.get("flags") != flags:
+            volume["flags"] = flags
+            self.schedule_profile_save()
 
     def _validated_scryptn(self, value: Optional[str]) -> tuple[Optional[str], bool]:
         if value is None or value == "":
@@ -1924,16 +2673,18 @@ class MainWindow(QMainWindow):
         return str(num), True
 
     def initialize_new_volume(self, volume_id, on_success=None):
-        volume = self.profiles[self.current_profile_name]["volumes"][volume_id]
+        volume = self.get_volume(volume_id)
+        if volume is None:
+            return
         cipher_dir = volume["cipher_dir"]
 
         # Check if already initialized
-        if os.path.exists(os.path.join(cipher_dir, "gocryptfs.conf")):
+        if is_gocryptfs_initialized(cipher_dir):
             if on_success:
                 on_success()
             return
 
-        # This now runs synchronously and will block until the password is set or cancelled.
+        # Prompts for the password, then initializes in the background and calls on_success when done.
         init_command = ["gocryptfs", "-init", cipher_dir]
         self.run_gocryptfs_command(
             init_command,
@@ -1970,11 +2721,19 @@ class MainWindow(QMainWindow):
     def close_app(self):
         """Properly closes the application."""
         self.is_quitting = True
+        self.simplified_view.flush_pending_flags()
         self.save_current_profile() # Save on quit
         QApplication.instance().quit()
 
+    def remember_password(self, password_str):
+        self.password_cache.store(password_str)
+        minutes = self.settings.value("password_cache_minutes", 0, type=int)
+        if minutes > 0:
+            self._password_cache_timer.start(minutes * 60 * 1000)
+
     def clear_cached_password(self):
-        self.cached_password = None
+        self._password_cache_timer.stop()
+        self.password_cache.clear()
         self.statusBar().showMessage("Session password cache cleared.", 3000)
 
     def write_to_terminal(self, command_str):
@@ -1983,11 +2742,12 @@ class MainWindow(QMainWindow):
 
     # --- Toggles ---
     def _animate_terminal_height(self, end_height):
-        self.animation = QPropertyAnimation(self.terminal_container, b"maximumHeight")
-        self.animation.setDuration(250)
-        self.animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self.animation.setEndValue(end_height)
-        self.animation.start()
+        animation = self._terminal_animation
+        # Restart from wherever an in-flight animation left the panel.
+        animation.stop()
+        animation.setStartValue(self.terminal_container.maximumHeight())
+        animation.setEndValue(end_height)
+        animation.start()
 
     def _set_terminal_visibility(self, visible: bool, animate: bool = True):
         self.terminal_visible = visible
@@ -2028,53 +2788,24 @@ def main():
     app.setQuitOnLastWindowClosed(False)
     app.setAttribute(Qt.ApplicationAttribute.AA_DontUseNativeMenuBar, False)
 
-    if subprocess.run(['which', 'gocryptfs'], capture_output=True).returncode != 0:
+    if not can_exec('gocryptfs'):
         QMessageBox.critical(None, "Dependency Error", "Required app 'gocryptfs' not found.")
         sys.exit(1)
 
+    # Created once per run; loading and saving profiles then assume it exists.
+    try:
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+    except OSError:
+        pass  # Surfaces as a save error later, with a message box.
+
     # --- First Run Wizard ---
     if not os.path.exists(PROFILES_FILE):
         wizard = MithrilSetupWizard()
         if wizard.exec() == QDialog.DialogCode.Accepted:
-            volume_data = {
-                "label": wizard.field("volumeLabel"),
-                "cipher_dir": wizard.field("cipherDir"),
-                "mount_point": wizard.field("mountPoint"),
-                "apply_perms": wizard.field("applyPerms"),
-                "auto_open_mount": wizard.field("openFolder"),
-                "automount_on_startup": False, # Default for new volumes
-                "volume_type": "standard", # Default for new volumes
-                "pin_to_tray": False, # Default for new volumes
-            }
-            try:
-                cipher_dir = volume_data["cipher_dir"]
-                mount_point = volume_data["mount_point"]
-
-                # Always create directories, then conditionally apply permissions.
-                os.makedirs(cipher_dir, exist_ok=True)
-                os.makedirs(mount_point, exist_ok=True)
-                
-                if wizard.field("applyPerms"):
-                    os.chmod(cipher_dir, 0o700)
-                    os.chmod(mount_point, 0o700)
-                    
-            except Exception as e:
-                QMessageBox.critical(None, "Permissions Error", f"Could not create directories or set permissions: {e}")
-
-            profiles = {"Default": {"volumes": [volume_data]}}
-            os.makedirs(os.path.dirname(PROFILES_FILE), exist_ok=True)
-            with open(PROFILES_FILE, 'w') as f:
-                json.dump(profiles, f, indent=4)
-
-            # We need a main window instance to run the initialization and mounting
+            # With no profiles file the window starts on an empty Default profile;
+            # the new volume is created, saved and initialized the same way as from the app.
             window = MainWindow()
-            new_volume_id = 0 # It's the first and only one
-            window.initialize_new_volume(new_volume_id)
-            
-            if wizard.field("mountNow"):
-                # Use a timer to ensure the main window is ready
-                QTimer.singleShot(100, lambda: window.mount_volume(new_volume_id))
-
+            window.add_volume_to_profile(wizard.volume_data(), mount=wizard.field("mountNow"))
             window.show()
             sys.exit(app.exec())
         else:
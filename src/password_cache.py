@@ -0,0 +1,44 @@
+import os
+from typing import Optional
+
+
+def wipe(buf: Optional[bytearray]) -> None:
+    """Overwrite a mutable secret buffer with zeros in place."""
+    if buf is not None:
+        buf[:] = bytes(len(buf))
+
+
+class PasswordCache:
+    """Holds a remembered password masked with a one-time random pad.
+
+    The plaintext is never kept as an immutable ``str``; only the masked bytes
+    and the pad live in memory, and both are zeroed when the cache is cleared.
+    """
+
+    def __init__(self):
+        self._masked: Optional[bytearray] = None
+        self._pad: Optional[bytearray] = None
+
+    def __bool__(self) -> bool:
+        return self._masked is not None
+
+    def store(self, password: str) -> None:
+        self.clear()
+        data = bytearray(password, "utf-8")
+        pad = bytearray(os.urandom(len(data)))
+        for i in range(len(data)):
+            data[i] ^= pad[i]
+        self._masked = data
+        self._pad = pad
+
+    def reveal(self) -> Optional[bytearray]:
+        """Return the plaintext in a fresh buffer; callers should wipe() it after use."""
+        if self._masked is None:
+            return None
+        return bytearray(m ^ p for m, p in zip(self._masked, self._pad))
+
+    def clear(self) -> None:
+        wipe(self._masked)
+        wipe(self._pad)
+        self._masked = None
+        self._pad = None
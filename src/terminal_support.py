@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, List, Optional
 
 from PyQt6.QtWidgets import QLabel, QTextBrowser, QVBoxLayout, QWidget
 
@@ -29,12 +29,16 @@ class TerminalProviderBase:
         # Base provider ignores writes.
         return
 
+    def write_lines(self, lines: List[str]) -> None:
+        return
+
 
 class QTermWidgetProvider(TerminalProviderBase):
     def __init__(self, widget_cls: type):
         super().__init__()
         self.widget_cls = widget_cls
         self._widget = None
+        self._send: Optional[Callable[[str], None]] = None
 
     def is_available(self) -> bool:
         return self.widget_cls is not None
@@ -48,18 +52,25 @@ class QTermWidgetProvider(TerminalProviderBase):
         if session.shell and hasattr(self._widget, "setShellProgram"):
             self._widget.setShellProgram(session.shell)
 
+        self._send = self._resolve_sender(self._widget)
         return self._widget
 
+    @staticmethod
+    def _resolve_sender(widget) -> Optional[Callable[[str], None]]:
+        # Probe the widget API once instead of on every write.
+        if hasattr(widget, "sendText"):
+            return widget.sendText
+        if hasattr(widget, "write"):  # Fallback for API variants
+            return lambda text: widget.write(text.encode())
+        return None
+
     def write(self, text: str) -> None:
-        if not self._widget:
+        self.write_lines([text])
+
+    def write_lines(self, lines: List[str]) -> None:
+        if self._send is None:
             return
-        if hasattr(self._widget, "sendText"):
-            self._widget.sendText(text + "\n")
-        elif hasattr(self._widget, "write"):  # Fallback for API variants
-            try:
-                self._widget.write((text + "\n").encode())
-            except Exception:
-                pass
+        self._send("".join(f"{line}\n" for line in lines))
 
 
 class NullTerminalProvider(TerminalProviderBase):
@@ -152,8 +163,12 @@ class TerminalManager:
         return self._widget
 
     def write(self, text: str) -> None:
+        self.write_lines([text])
+
+    def write_lines(self, lines: List[str]) -> None:
+        """Send several lines to the terminal in a single provider call."""
         try:
-            self.provider.write(text)
+            self.provider.write_lines(lines)
         except Exception:
             # Writing to the terminal is best-effort; ignore provider-specific failures.
             pass
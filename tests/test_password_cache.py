@@ -0,0 +1,47 @@
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.insert(0, ROOT)
+
+import password_cache as pc  # noqa: E402
+
+
+def test_store_and_reveal_roundtrip():
+    cache = pc.PasswordCache()
+    assert not cache
+    assert cache.reveal() is None
+
+    cache.store("correct horse ✓")
+    assert cache
+    assert cache.reveal() == "correct horse ✓".encode("utf-8")
+
+
+def test_plaintext_is_not_held_unmasked():
+    cache = pc.PasswordCache()
+    cache.store("hunter2hunter2hunter2")
+    assert bytes(cache._masked) != b"hunter2hunter2hunter2"
+
+
+def test_clear_zeroes_buffers():
+    cache = pc.PasswordCache()
+    cache.store("secret")
+    masked, pad = cache._masked, cache._pad
+
+    cache.clear()
+
+    assert not cache
+    assert cache.reveal() is None
+    assert masked == bytearray(len(masked))
+    assert pad == bytearray(len(pad))
+
+
+def test_reveal_returns_wipeable_buffer():
+    cache = pc.PasswordCache()
+    cache.store("secret")
+    plain = cache.reveal()
+
+    pc.wipe(plain)
+
+    assert plain == bytearray(6)
+    assert cache.reveal() == bytearray(b"secret")
@@ -60,6 +60,48 @@ class DetectionTests(TestCase):
         self.assertGreater(len(result.import_attempts), 0)
 
 
+class _SendTextWidget:
+    def __init__(self, parent=None):
+        self.sent = []
+
+    def sendText(self, text):
+        self.sent.append(text)
+
+
+class _WriteWidget:
+    def __init__(self, parent=None):
+        self.written = []
+
+    def write(self, data):
+        self.written.append(data)
+
+
+class ProviderWriteTests(TestCase):
+    def _session(self):
+        return ts.TerminalSession(session_id="test", working_directory="/tmp")
+
+    def test_write_before_widget_is_ignored(self):
+        provider = ts.QTermWidgetProvider(_SendTextWidget)
+        provider.write("echo hi")
+
+    def test_write_lines_sends_once(self):
+        provider = ts.QTermWidgetProvider(_SendTextWidget)
+        widget = provider.create_widget(self._session())
+
+        provider.write_lines(["one", "two"])
+        provider.write("three")
+
+        self.assertEqual(widget.sent, ["one\ntwo\n", "three\n"])
+
+    def test_write_falls_back_to_bytes_api(self):
+        provider = ts.QTermWidgetProvider(_WriteWidget)
+        widget = provider.create_widget(self._session())
+
+        provider.write("ls")
+
+        self.assertEqual(widget.written, [b"ls\n"])
+
+
 if __name__ == "__main__":
     import unittest
 